@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import asyncio
 from pathlib import Path
 
 import typer
 from hiro_channel_sdk import PluginTransport, log_setup
 from hiro_commons.constants.network import DEFAULT_LOCALHOST, PORT_OFFSET_PLUGIN, PORT_RANGE_START
 from hiro_commons.constants.storage import LOGS_DIR
+from hiro_commons.eventloop import run as run_event_loop
 
 from .plugin import DevicesChannel
 
@@ -39,7 +39,7 @@ def run(
     plugin = DevicesChannel()
     log_setup.init(f"plugin-{plugin.info.name}", Path(log_dir))
     transport = PluginTransport(plugin, hiro_ws)
-    asyncio.run(transport.run())
+    run_event_loop(transport.run())
 
 
 if __name__ == "__main__":
@@ -8,34 +8,68 @@ Owns the gateway WebSocket connection and translates between:
 from __future__ import annotations
 
 import asyncio
-import json
+import contextlib
+import random
 from datetime import datetime, timezone
 from pathlib import Path
 
 import websockets
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from hiro_commons.encoding import JSONDecodeError, json_dumps, json_loads
 from hiro_commons.keys import load_private_key_pem
 from hiro_commons.signing import sign_nonce
+from pydantic import BaseModel, Field, ValidationError
+from pydantic_core import to_json
 from websockets.exceptions import ConnectionClosed
 from hiro_commons.log import Logger
 
 from hiro_channel_sdk import ChannelInfo, ChannelPlugin, UnifiedMessage
-from hiro_channel_sdk.constants import AUTH_ROLE_DESKTOP, RECONNECT_BACKOFF_BASE, RECONNECT_BACKOFF_MAX
+from hiro_channel_sdk.constants import (
+    AUTH_ROLE_DESKTOP,
+    RECONNECT_BACKOFF_FACTOR,
+    RECONNECT_BACKOFF_INITIAL,
+    RECONNECT_BACKOFF_MAX,
+    RECONNECT_BACKOFF_MIN,
+)
 from hiro_commons.constants.domain import MANDATORY_CHANNEL_NAME
-from hiro_commons.constants.network import DEFAULT_GATEWAY_PORT
+from hiro_commons.constants.network import (
+    DEFAULT_GATEWAY_PORT,
+    WS_MAX_QUEUE,
+    WS_PING_TIMEOUT_SECONDS,
+    WS_WRITE_LIMIT,
+)
 from hiro_commons.constants.timing import DEFAULT_PING_INTERVAL_SECONDS
 
 log = Logger.get("DEVICES")
 
-BACKOFF_BASE = RECONNECT_BACKOFF_BASE
+BACKOFF_INITIAL = RECONNECT_BACKOFF_INITIAL
+BACKOFF_MIN = RECONNECT_BACKOFF_MIN
+BACKOFF_FACTOR = RECONNECT_BACKOFF_FACTOR
 BACKOFF_MAX = RECONNECT_BACKOFF_MAX
 AUTH_TIMEOUT_SECONDS = 15.0
+SEND_QUEUE_MAXSIZE = 1024
 
 
 def _default_master_key_path() -> Path:
     return Path.home() / ".hirocli" / "master_key.pem"
 
 
+class _GatewayEnvelope(BaseModel):
+    """Inbound relay frame; ``payload`` is validated straight from JSON bytes."""
+
+    type: str | None = None
+    payload: UnifiedMessage | None = None
+    sender_device_id: str | None = None
+    target_device_id: str | None = None
+
+
+class _PairingRequest(BaseModel):
+    request_id: str = Field(min_length=1)
+    pairing_code: str = Field(min_length=1)
+    device_public_key: str = Field(min_length=1)
+    device_name: str | None = None
+
+
 class DevicesChannel(ChannelPlugin):
     @property
     def info(self) -> ChannelInfo:
@@ -53,6 +87,12 @@ class DevicesChannel(ChannelPlugin):
         self._master_private_key: Ed25519PrivateKey | None = None
         self._runner_task: asyncio.Task[None] | None = None
         self._gateway_ws: websockets.WebSocketClientProtocol | None = None
+        # Outbound frames are handed to a single per-connection writer task so
+        # callers don't serialise behind the websocket's send lock.  Callers
+        # never wait on it (send() runs inside the SDK's RPC loop): a full
+        # queue drops the frame, and whatever is left at disconnect is dropped
+        # too, the same as messages sent while no gateway is connected.
+        self._tx_queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=SEND_QUEUE_MAXSIZE)
 
     async def on_configure(self, config: dict) -> None:
         self._gateway_url = str(config.get("gateway_url", self._gateway_url))
@@ -75,7 +115,11 @@ class DevicesChannel(ChannelPlugin):
             raise RuntimeError(
                 f"devices channel requires master key file: {self._master_key_path}"
             )
-        self._master_private_key = load_private_key_pem(self._master_key_path.read_bytes())
+        # File read + PEM parse off the loop: slow disks would otherwise stall
+        # the plugin's RPC connection during startup.
+        self._master_private_key = await asyncio.to_thread(
+            lambda: load_private_key_pem(self._master_key_path.read_bytes())
+        )
         if self._runner_task is None:
             self._runner_task = asyncio.create_task(self._run_gateway_loop())
 
@@ -99,9 +143,9 @@ class DevicesChannel(ChannelPlugin):
         if self._gateway_ws is None:
             log.warning("Gateway not connected — dropping outbound message")
             return
-        out = {
-            "payload": message.model_dump(mode="json"),
-        }
+        # The model is embedded as-is: pydantic-core serialises the whole
+        # envelope to JSON bytes in one pass, with no intermediate payload dict.
+        out: dict[str, object] = {"payload": message}
         if message.recipient_id:
             out["target_device_id"] = message.recipient_id
         log.info(
@@ -110,31 +154,70 @@ class DevicesChannel(ChannelPlugin):
             recipient=message.recipient_id or "*",
             content_type=message.content_type,
         )
-        await self._gateway_ws.send(json.dumps(out))
+        self._enqueue_frame(to_json(out))
+
+    def _enqueue_frame(self, frame: bytes) -> None:
+        try:
+            self._tx_queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            log.warning("Gateway send queue full — dropping outbound frame", size=len(frame))
+
+    def _drop_queued_frames(self) -> None:
+        queue = self._tx_queue
+        dropped = 0
+        while not queue.empty():
+            queue.get_nowait()
+            dropped += 1
+        if dropped:
+            log.warning("Gateway disconnected — dropping queued outbound frames", count=dropped)
 
     async def _run_gateway_loop(self) -> None:
-        backoff = BACKOFF_BASE
         url = self._gateway_url
+        # None means "next retry is the first after a good connection": it is
+        # jittered so a gateway restart does not get every client back at once.
+        backoff_delay: float | None = None
 
         while True:
+            error: str | None = None
             try:
-                await self._run_gateway_connection(url)
-                log.warning("Gateway disconnected, reconnecting", delay=f"{backoff:.0f}s")
+                # Only an authenticated session resets the backoff; handshake
+                # failures keep growing the delay.
+                if await self._run_gateway_connection(url):
+                    backoff_delay = None
             except asyncio.CancelledError:
                 raise
             except Exception as exc:
-                log.warning("Gateway error, reconnecting", error=str(exc), delay=f"{backoff:.0f}s")
+                error = str(exc)
+
+            if backoff_delay is None:
+                delay = random.random() * BACKOFF_INITIAL
+                backoff_delay = BACKOFF_MIN
+            else:
+                delay = backoff_delay
+                backoff_delay = min(backoff_delay * BACKOFF_FACTOR, BACKOFF_MAX)
+
+            if error is None:
+                log.warning("Gateway disconnected, reconnecting", delay=f"{delay:.1f}s")
+            else:
+                log.warning("Gateway error, reconnecting", error=error, delay=f"{delay:.1f}s")
 
             await self.emit_event(
                 "gateway_disconnected",
                 {"gateway_url": self._gateway_url, "device_id": self._device_id},
             )
-            await asyncio.sleep(backoff)
-            backoff = min(backoff * 2, BACKOFF_MAX)
+            await asyncio.sleep(delay)
 
-    async def _run_gateway_connection(self, url: str) -> None:
+    async def _run_gateway_connection(self, url: str) -> bool:
+        """Run one gateway session; returns True once it ended after a successful auth."""
         log.info("Connecting to gateway", url=url)
-        async with websockets.connect(url, ping_interval=self._ping_interval) as ws:
+        async with websockets.connect(
+            url,
+            ping_interval=self._ping_interval,
+            ping_timeout=WS_PING_TIMEOUT_SECONDS,
+            max_queue=WS_MAX_QUEUE,
+            write_limit=WS_WRITE_LIMIT,
+            compression=None,
+        ) as ws:
             await self._authenticate_with_gateway(ws)
             self._gateway_ws = ws
             await self.emit_event(
@@ -143,13 +226,31 @@ class DevicesChannel(ChannelPlugin):
             )
             log.info("Connected to gateway", device_id=self._device_id)
 
+            writer_task = asyncio.create_task(self._run_gateway_writer(ws))
             try:
                 async for raw in ws:
-                    await self._handle_gateway_message(str(raw))
+                    await self._handle_gateway_message(raw)
             except ConnectionClosed:
                 pass
             finally:
                 self._gateway_ws = None
+                writer_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await writer_task
+                # Frames queued for this session must not reach a later one.
+                self._drop_queued_frames()
+        return True
+
+    async def _run_gateway_writer(self, ws: websockets.WebSocketClientProtocol) -> None:
+        """Drain queued outbound frames onto *ws* until the connection closes."""
+        queue = self._tx_queue
+        while True:
+            frame = await queue.get()
+            try:
+                await ws.send(frame)
+            except ConnectionClosed:
+                log.warning("Gateway connection closed — dropping outbound frame", size=len(frame))
+                return
 
     async def _authenticate_with_gateway(
         self, ws: websockets.WebSocketClientProtocol
@@ -158,14 +259,16 @@ class DevicesChannel(ChannelPlugin):
         if key is None:
             raise RuntimeError("master private key is not loaded")
 
+        # asyncio.timeout scopes the deadline without wrapping recv() in a Task.
         try:
-            raw = await asyncio.wait_for(ws.recv(), timeout=AUTH_TIMEOUT_SECONDS)
-        except asyncio.TimeoutError as exc:
+            async with asyncio.timeout(AUTH_TIMEOUT_SECONDS):
+                raw = await ws.recv()
+        except TimeoutError as exc:
             raise RuntimeError("gateway auth challenge timeout") from exc
 
         try:
-            challenge = json.loads(str(raw))
-        except json.JSONDecodeError as exc:
+            challenge = json_loads(raw)
+        except JSONDecodeError as exc:
             raise RuntimeError("gateway auth challenge is not JSON") from exc
 
         if challenge.get("type") != "auth_challenge":
@@ -180,16 +283,17 @@ class DevicesChannel(ChannelPlugin):
             "device_id": self._device_id,
             "nonce_signature": sign_nonce(key, nonce),
         }
-        await ws.send(json.dumps(auth_response))
+        await ws.send(json_dumps(auth_response))
 
         try:
-            auth_ack_raw = await asyncio.wait_for(ws.recv(), timeout=AUTH_TIMEOUT_SECONDS)
-        except asyncio.TimeoutError as exc:
+            async with asyncio.timeout(AUTH_TIMEOUT_SECONDS):
+                auth_ack_raw = await ws.recv()
+        except TimeoutError as exc:
             raise RuntimeError("gateway auth ack timeout") from exc
 
         try:
-            auth_ack = json.loads(str(auth_ack_raw))
-        except json.JSONDecodeError as exc:
+            auth_ack = json_loads(auth_ack_raw)
+        except JSONDecodeError as exc:
             raise RuntimeError("gateway auth ack is not JSON") from exc
 
         if auth_ack.get("type") != "auth_ok":
@@ -197,27 +301,22 @@ class DevicesChannel(ChannelPlugin):
 
         log.info("Gateway auth successful", device_id=self._device_id)
 
-    async def _handle_gateway_message(self, raw: str) -> None:
+    async def _handle_gateway_message(self, raw: str | bytes) -> None:
+        # One compiled pydantic pass parses the JSON and validates the envelope
+        # and its UnifiedMessage payload, replacing per-field isinstance checks.
         try:
-            msg = json.loads(raw)
-        except json.JSONDecodeError:
-            log.warning("Invalid JSON from gateway", raw=raw[:200])
-            return
-
-        msg_type = msg.get("type")
-        if msg_type == "pairing_request":
-            await self._handle_pairing_request(msg)
+            envelope = _GatewayEnvelope.model_validate_json(raw)
+        except ValidationError as exc:
+            log.warning("Invalid frame from gateway", error=str(exc), raw=raw[:200])
             return
 
-        payload = msg.get("payload")
-        if not isinstance(payload, dict):
-            log.warning("Gateway payload is not an object", payload=payload)
+        if envelope.type == "pairing_request":
+            await self._handle_pairing_request(raw)
             return
 
-        try:
-            unified = UnifiedMessage.model_validate(payload)
-        except Exception as exc:
-            log.warning("Invalid UnifiedMessage from gateway", error=str(exc))
+        unified = envelope.payload
+        if unified is None:
+            log.warning("Gateway frame has no payload object")
             return
 
         # Override the sender's timestamp with the server's receive time.
@@ -226,14 +325,14 @@ class DevicesChannel(ChannelPlugin):
         # server actually received them, not by whatever clock the sender runs.
         unified.timestamp = datetime.now(timezone.utc)
 
-        sender_device_id = msg.get("sender_device_id")
-        if isinstance(sender_device_id, str) and sender_device_id:
+        sender_device_id = envelope.sender_device_id
+        if sender_device_id:
             unified.sender_id = sender_device_id
-            unified.metadata = {
-                **(unified.metadata or {}),
-                "friendly_name": sender_device_id,
-                "sender_device_id": sender_device_id,
-            }
+            # The model was just validated from this frame, so its metadata
+            # dict is ours to update in place (no copy per inbound message).
+            metadata = unified.metadata
+            metadata["friendly_name"] = sender_device_id
+            metadata["sender_device_id"] = sender_device_id
 
         unified.channel = MANDATORY_CHANNEL_NAME
         unified.direction = "inbound"
@@ -245,38 +344,27 @@ class DevicesChannel(ChannelPlugin):
         )
         await self.emit(unified)
 
-    async def _handle_pairing_request(self, msg: dict) -> None:
-        request_id = msg.get("request_id")
-        pairing_code = msg.get("pairing_code")
-        device_public_key = msg.get("device_public_key")
-        if not isinstance(request_id, str) or not request_id:
-            log.warning("Pairing request missing request_id")
-            return
-        if not isinstance(pairing_code, str) or not pairing_code:
-            log.warning("Pairing request missing pairing_code")
-            return
-        if not isinstance(device_public_key, str) or not device_public_key:
-            log.warning("Pairing request missing device_public_key")
+    async def _handle_pairing_request(self, raw: str | bytes) -> None:
+        try:
+            request = _PairingRequest.model_validate_json(raw)
+        except ValidationError as exc:
+            log.warning("Invalid pairing request", error=str(exc))
             return
 
-        device_name_raw = msg.get("device_name")
-        device_name = device_name_raw if isinstance(device_name_raw, str) and device_name_raw else None
-
-        log.info("Pairing request received", request_id=request_id)
+        log.info("Pairing request received", request_id=request.request_id)
         event_data: dict[str, object] = {
-            "request_id": request_id,
-            "pairing_code": pairing_code,
-            "device_public_key": device_public_key,
+            "request_id": request.request_id,
+            "pairing_code": request.pairing_code,
+            "device_public_key": request.device_public_key,
         }
-        if device_name:
-            event_data["device_name"] = device_name
+        if request.device_name:
+            event_data["device_name"] = request.device_name
         await self.emit_event("pairing_request", event_data)
 
     async def on_event(self, event: str, data: dict) -> None:
         if event != "pairing_response":
             return
-        ws = self._gateway_ws
-        if ws is None:
+        if self._gateway_ws is None:
             log.warning("Gateway not connected — cannot send pairing_response")
             return
 
@@ -307,4 +395,4 @@ class DevicesChannel(ChannelPlugin):
             reason = data.get("reason")
             outbound["reason"] = reason if isinstance(reason, str) and reason else "rejected"
 
-        await ws.send(json.dumps(outbound))
+        self._enqueue_frame(json_dumps(outbound))
@@ -6,7 +6,6 @@ Invoked by hirocli's ChannelManager as:
 
 from __future__ import annotations
 
-import asyncio
 from pathlib import Path
 
 import typer
@@ -15,6 +14,7 @@ from hiro_channel_sdk import log_setup
 from hiro_channel_sdk.transport import PluginTransport
 from hiro_commons.constants.network import DEFAULT_LOCALHOST, PORT_OFFSET_PLUGIN, PORT_RANGE_START
 from hiro_commons.constants.storage import LOGS_DIR
+from hiro_commons.eventloop import run as run_event_loop
 
 from .plugin import EchoChannel
 
@@ -46,7 +46,7 @@ def run(
     plugin = EchoChannel()
     log_setup.init(f"plugin-{plugin.info.name}", Path(log_dir))
     transport = PluginTransport(plugin, hiro_ws)
-    asyncio.run(transport.run())
+    run_event_loop(transport.run())
 
 
 if __name__ == "__main__":
@@ -27,22 +27,24 @@ class GatewayAuthManager:
         desktop_public_key_b64: str,
     ) -> None:
         self._desktop_public_key: Ed25519PublicKey = load_public_key_b64(desktop_public_key_b64)
+        # Serialised once: the trust root never changes for the manager's lifetime.
+        self._desktop_public_key_b64: str = public_key_to_b64(self._desktop_public_key)
 
     def is_claimed(self) -> bool:
         return True
 
     def desktop_public_key_b64(self) -> str | None:
-        return public_key_to_b64(self._desktop_public_key)
+        return self._desktop_public_key_b64
 
-    def verify_desktop_auth(self, *, nonce_hex: str, nonce_signature_b64: str) -> AuthResult:
-        if not verify_signature(self._desktop_public_key, bytes.fromhex(nonce_hex), nonce_signature_b64):
+    def verify_desktop_auth(self, *, nonce: bytes, nonce_signature_b64: str) -> AuthResult:
+        if not verify_signature(self._desktop_public_key, nonce, nonce_signature_b64):
             return AuthResult(ok=False, reason="desktop signature invalid")
         return AuthResult(ok=True)
 
     def verify_device_auth(
         self,
         *,
-        nonce_hex: str,
+        nonce: bytes,
         attestation_blob: str,
         desktop_signature_b64: str,
         nonce_signature_b64: str,
@@ -61,7 +63,7 @@ class GatewayAuthManager:
 
         try:
             device_key = load_public_key_b64(attestation.device_public_key_b64)
-            if not verify_signature(device_key, bytes.fromhex(nonce_hex), nonce_signature_b64):
+            if not verify_signature(device_key, nonce, nonce_signature_b64):
                 return AuthResult(ok=False, reason="device nonce signature invalid")
         except Exception:
             return AuthResult(ok=False, reason="device nonce signature invalid")
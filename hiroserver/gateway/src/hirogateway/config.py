@@ -7,6 +7,7 @@ from typing import Optional
 
 from pydantic import BaseModel
 
+from hiro_commons.atomic import atomic_write_bytes
 from hiro_commons.constants.storage import CONFIG_FILENAME, LOGS_DIR
 
 STATE_FILENAME = "state.json"
@@ -71,8 +72,9 @@ def load_state(instance_path: Path) -> GatewayState:
 
 
 def save_state(instance_path: Path, state: GatewayState) -> None:
-    instance_path.mkdir(parents=True, exist_ok=True)
-    instance_state_file(instance_path).write_text(
-        state.model_dump_json(indent=2),
-        encoding="utf-8",
+    # Rewritten on every desktop (dis)connect while `status` may be reading it;
+    # the atomic replace means a reader never sees a truncated file.
+    atomic_write_bytes(
+        instance_state_file(instance_path),
+        state.model_dump_json(indent=2).encode("utf-8"),
     )
@@ -17,6 +17,8 @@ from typing import Optional
 import typer
 import websockets
 from hiro_channel_sdk import log_setup
+from hiro_commons.constants.network import WS_MAX_QUEUE, WS_PING_TIMEOUT_SECONDS, WS_WRITE_LIMIT
+from hiro_commons.eventloop import run as run_event_loop
 from hiro_commons.log import Logger
 from hiro_commons.process import is_running, read_pid, write_pid
 from rich.console import Console
@@ -95,32 +97,55 @@ def _run_gateway(
     configure_auth(auth_manager)
     configure_instance_path(instance_path)
     log.info("Gateway trust root configured", instance=entry.name)
-    asyncio.run(_serve(entry.host, entry.port))
+    run_event_loop(_serve(entry.host, entry.port))
+
+
+_STOP_SIGNALS = (signal.SIGTERM, signal.SIGINT)
 
 
 async def _serve(host: str, port: int) -> None:
     log = Logger.get("GATEWAY")
-    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    # A bare future is resolved directly by the signal callback — no Event
+    # waiter bookkeeping, and repeated signals are ignored once it is done.
+    stopped: asyncio.Future[None] = loop.create_future()
 
     def _shutdown(*_: object) -> None:
+        if stopped.done():
+            return
         log.info("Shutdown signal received")
-        stop_event.set()
+        stopped.set_result(None)
 
-    loop = asyncio.get_running_loop()
     if sys.platform != "win32":
-        for sig in (signal.SIGTERM, signal.SIGINT):
+        for sig in _STOP_SIGNALS:
             loop.add_signal_handler(sig, _shutdown)
     else:
         # signal handlers on Windows run in the main thread outside the event
-        # loop, so call_soon_threadsafe is required to safely set the asyncio
-        # Event from there.
-        signal.signal(signal.SIGTERM, lambda *_: loop.call_soon_threadsafe(stop_event.set))
-        signal.signal(signal.SIGINT, lambda *_: loop.call_soon_threadsafe(stop_event.set))
-
-    async with websockets.serve(handle_connection, host, port, reuse_address=True) as server:
-        log.info("Gateway listening", url=f"ws://{host}:{port}")
-        await stop_event.wait()
-        log.info("Shutting down", connected_devices=get_connected_devices())
+        # loop, so call_soon_threadsafe is required to safely resolve the
+        # future from there.
+        for sig in _STOP_SIGNALS:
+            signal.signal(sig, lambda *_: loop.call_soon_threadsafe(_shutdown))
+
+    try:
+        async with websockets.serve(
+            handle_connection,
+            host,
+            port,
+            reuse_address=True,
+            ping_timeout=WS_PING_TIMEOUT_SECONDS,
+            max_queue=WS_MAX_QUEUE,
+            write_limit=WS_WRITE_LIMIT,
+            compression=None,
+        ) as server:
+            # Surfaces whether hiro_commons.eventloop picked uvloop on this host.
+            log.info("Gateway listening", url=f"ws://{host}:{port}", loop=type(loop).__module__)
+            await stopped
+            log.info("Shutting down", connected_devices=get_connected_devices())
+    finally:
+        # Leave the loop clean so _serve can be run again in the same process.
+        if sys.platform != "win32":
+            for sig in _STOP_SIGNALS:
+                loop.remove_signal_handler(sig)
 
     log.info("Gateway stopped")
 
@@ -5,6 +5,9 @@ Connections are authenticated with a nonce challenge:
 2) peer responds with {"type":"auth_response", ...}
 3) on success, the socket is registered with its authenticated device_id
 
+The device_id always comes from the verified auth payload; the connection
+URL path/query string is never parsed.
+
 Messages are JSON objects with an optional `target_device_id` field:
   - Present  -> unicast to that specific device
   - Absent   -> broadcast to all OTHER connected devices
@@ -20,14 +23,15 @@ Message envelope:
 from __future__ import annotations
 
 import asyncio
-import json
+import binascii
 import secrets
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict
+from typing import Awaitable, Callable, Dict
 
 import websockets
 from websockets.asyncio.server import ServerConnection
+from hiro_commons.encoding import JSONDecodeError, json_dumps, json_loads
 from hiro_commons.nonces import generate_nonce
 from hiro_commons.log import Logger
 
@@ -62,6 +66,15 @@ PAIRING_WAIT_SECONDS = DEFAULT_PAIRING_WAIT_SECONDS
 
 _instance_path: "Path | None" = None
 
+# Fixed-shape frames whose only variable part is a hex token (ASCII, never
+# needs JSON escaping), so they are spliced together instead of encoded.
+_AUTH_CHALLENGE_PREFIX = b'{"type":"auth_challenge","nonce":"'
+_PAIRING_PENDING_PREFIX = b'{"type":"pairing_pending","request_id":"'
+_FRAME_STRING_SUFFIX = b'"}'
+_PAIRING_STATUSES = frozenset(("approved", "rejected"))
+# Serialises state.json read-modify-write cycles, which run in worker threads.
+_state_lock = asyncio.Lock()
+
 
 def _message_id(msg: dict[str, object]) -> str | None:
     payload = msg.get("payload")
@@ -83,48 +96,63 @@ def configure_instance_path(instance_path: Path) -> None:
     _instance_path = instance_path
 
 
-def _write_desktop_connected() -> None:
-    if _instance_path is None:
+async def _update_state(update: Callable[[GatewayState], None]) -> None:
+    """Apply *update* to the persisted state without blocking the event loop."""
+    instance_path = _instance_path
+    if instance_path is None:
         return
-    state = load_state(_instance_path)
-    state.desktop_connected = True
-    state.last_connected = datetime.now(timezone.utc).isoformat()
-    state.last_auth_error = None
-    save_state(_instance_path, state)
 
+    def _apply() -> None:
+        state = load_state(instance_path)
+        update(state)
+        save_state(instance_path, state)
 
-def _write_desktop_disconnected() -> None:
-    if _instance_path is None:
-        return
-    state = load_state(_instance_path)
-    state.desktop_connected = False
-    save_state(_instance_path, state)
+    async with _state_lock:
+        await asyncio.to_thread(_apply)
 
 
-def _write_auth_error(reason: str) -> None:
-    if _instance_path is None:
-        return
-    state = load_state(_instance_path)
-    state.desktop_connected = False
-    state.last_auth_error = reason
-    save_state(_instance_path, state)
+async def _write_desktop_connected() -> None:
+    def _update(state: GatewayState) -> None:
+        state.desktop_connected = True
+        state.last_connected = datetime.now(timezone.utc).isoformat()
+        state.last_auth_error = None
+
+    await _update_state(_update)
+
+
+async def _write_desktop_disconnected() -> None:
+    def _update(state: GatewayState) -> None:
+        state.desktop_connected = False
+
+    await _update_state(_update)
+
+
+async def _write_auth_error(reason: str) -> None:
+    def _update(state: GatewayState) -> None:
+        state.desktop_connected = False
+        state.last_auth_error = reason
+
+    await _update_state(_update)
 
 
 async def register(device_id: str, ws: ServerConnection) -> bool:
     async with _registry_lock:
-        if device_id in _registry:
-            old_ws = _registry[device_id]
-            if old_ws is ws:
-                return True
-            log.warning("Duplicate device connection rejected", device_id=device_id)
-            try:
-                await ws.close(code=WS_CLOSE_DUPLICATE_DEVICE, reason="device already connected")
-            except Exception:
-                pass
-            return False
-        _registry[device_id] = ws
-        log.info("Device registered", device_id=device_id, total=len(_registry))
-        return True
+        old_ws = _registry.get(device_id)
+        if old_ws is None:
+            _registry[device_id] = ws
+            log.info("Device registered", device_id=device_id, total=len(_registry))
+            return True
+        if old_ws is ws:
+            return True
+
+    # Close the duplicate after releasing the lock: the close handshake can take
+    # seconds, and every relay_message would otherwise queue behind it.
+    log.warning("Duplicate device connection rejected", device_id=device_id)
+    try:
+        await ws.close(code=WS_CLOSE_DUPLICATE_DEVICE, reason="device already connected")
+    except Exception:
+        pass
+    return False
 
 
 async def unregister(device_id: str, ws: ServerConnection) -> None:
@@ -134,51 +162,151 @@ async def unregister(device_id: str, ws: ServerConnection) -> None:
             log.info("Device unregistered", device_id=device_id, total=len(_registry))
 
 
-async def relay_message(sender_id: str, raw: str) -> None:
-    try:
-        msg = json.loads(raw)
-    except json.JSONDecodeError:
-        log.warning("Non-JSON message ignored", sender_id=sender_id)
-        return
-
-    msg["sender_device_id"] = sender_id
+async def relay_message(sender_id: str, raw: str | bytes, msg: dict) -> None:
+    """Route one frame; *msg* is *raw* already parsed by the caller."""
     target_id: str | None = msg.get("target_device_id")
     msg_id = _message_id(msg)
-    out = json.dumps(msg)
-
-    async with _registry_lock:
-        if target_id:
-            target_ws = _registry.get(target_id)
-            if target_ws is None:
-                log.warning(
-                    "Target device not connected, message dropped",
-                    target_id=target_id,
-                    sender_id=sender_id,
-                    msg_id=msg_id or "-",
-                )
-                return
-            recipients = [(target_id, target_ws)]
-        else:
-            recipients = [(did, ws) for did, ws in _registry.items() if did != sender_id]
-
-    for did, ws in recipients:
-        try:
-            await ws.send(out)
-            log.info(
-                "Message relayed",
+    # Device apps only accept text frames, even when the sender (e.g. the
+    # desktop plugin) used a binary frame. Encoding once and sending the UTF-8
+    # bytes with text=True keeps text framing without websockets re-encoding
+    # a str for every recipient.
+    frame = raw.encode("utf-8") if isinstance(raw, str) else raw
+    if msg and "sender_device_id" not in msg and frame[:1] == b"{":
+        # The frame is already valid JSON: splice the sender key in after the
+        # opening brace instead of re-serialising the whole message. A
+        # client-supplied sender_device_id falls through to the overwrite
+        # below, so duplicate keys can never spoof the sender.
+        out = b'{"sender_device_id":' + json_dumps(sender_id) + b"," + frame[1:]
+    else:
+        msg["sender_device_id"] = sender_id
+        out = json_dumps(msg)
+
+    if target_id:
+        # Unicast reads one key without the lock: a single dict.get is atomic
+        # under the GIL and there is no await in between. If the device
+        # unregisters concurrently, the send below raises and is logged.
+        target_ws = _registry.get(target_id)
+        if target_ws is None:
+            log.warning(
+                "Target device not connected, message dropped",
+                target_id=target_id,
+                sender_id=sender_id,
                 msg_id=msg_id or "-",
-                sender=sender_id,
-                recipient=did,
-                target=target_id or "*",
             )
+            return
+        recipients = [(target_id, target_ws)]
+    else:
+        async with _registry_lock:
+            # C-level copy only; the sender is filtered out after the lock.
+            snapshot = list(_registry.items())
+        recipients = [(did, ws) for did, ws in snapshot if did != sender_id]
+
+    if len(recipients) == 1:
+        did, ws = recipients[0]
+        try:
+            await ws.send(out, text=True)
         except Exception as exc:
-            log.warning("Failed to send to device", device_id=did, error=str(exc))
+            results: list[BaseException | None] = [exc]
+        else:
+            results = [None]
+    else:
+        # Broadcast: start every send at once instead of awaiting each device
+        # in turn, so one slow socket no longer delays the rest. Each recipient
+        # is its own socket with a single frame, so TCP_CORK would have nothing
+        # to coalesce; asyncio and uvloop already set TCP_NODELAY.
+        results = await asyncio.gather(
+            *(ws.send(out, text=True) for _, ws in recipients),
+            return_exceptions=True,
+        )
+
+    # No isEnabledFor() guard needed: Logger.configure uses structlog's
+    # filtering bound logger, so levels below the threshold are bound to a
+    # no-op. Only the per-recipient fields are computed inside the loop.
+    log_msg_id = msg_id or "-"
+    log_target = target_id or "*"
+    for (did, _), result in zip(recipients, results):
+        if isinstance(result, BaseException):
+            log.warning("Failed to send to device", device_id=did, error=str(result))
+            continue
+        log.info(
+            "Message relayed",
+            msg_id=log_msg_id,
+            sender=sender_id,
+            recipient=did,
+            target=log_target,
+        )
+
+
+_AuthOutcome = tuple[bool, str | None, str, str | None]
+
+
+async def _authenticate_desktop(
+    auth: GatewayAuthManager,
+    nonce: bytes,
+    msg: dict[str, object],
+) -> _AuthOutcome:
+    device_id = msg.get("device_id")
+    signature = msg.get("nonce_signature") or msg.get("signature")
+    if not isinstance(device_id, str) or not device_id:
+        return False, None, "desktop auth requires device_id", None
+    if not isinstance(signature, str) or not signature:
+        return False, None, "desktop auth requires nonce_signature", None
+    # Ed25519 verification runs in a worker thread (cryptography releases
+    # the GIL), so concurrent handshakes don't serialise on the loop.
+    result = await asyncio.to_thread(
+        auth.verify_desktop_auth,
+        nonce=nonce,
+        nonce_signature_b64=signature,
+    )
+    return (
+        result.ok,
+        device_id if result.ok else None,
+        result.reason or "auth failed",
+        AUTH_ROLE_DESKTOP,
+    )
+
+
+async def _authenticate_device(
+    auth: GatewayAuthManager,
+    nonce: bytes,
+    msg: dict[str, object],
+) -> _AuthOutcome:
+    attestation = msg.get("attestation")
+    nonce_signature = msg.get("nonce_signature") or msg.get("signature")
+    if not isinstance(attestation, dict):
+        return False, None, "device auth requires attestation object", None
+    if not isinstance(nonce_signature, str) or not nonce_signature:
+        return False, None, "device auth requires nonce_signature", None
+    blob = attestation.get("blob")
+    desktop_signature = attestation.get("desktop_signature")
+    if not isinstance(blob, str) or not blob:
+        return False, None, "attestation.blob is required", None
+    if not isinstance(desktop_signature, str) or not desktop_signature:
+        return False, None, "attestation.desktop_signature is required", None
+    result = await asyncio.to_thread(
+        auth.verify_device_auth,
+        nonce=nonce,
+        attestation_blob=blob,
+        desktop_signature_b64=desktop_signature,
+        nonce_signature_b64=nonce_signature,
+    )
+    return result.ok, result.device_id, result.reason or "auth failed", AUTH_ROLE_DEVICE
+
+
+# auth_mode -> handler; one lookup replaces the if-chain per handshake.
+_AUTH_HANDLERS: Dict[
+    str,
+    Callable[[GatewayAuthManager, bytes, dict[str, object]], Awaitable[_AuthOutcome]],
+] = {
+    AUTH_ROLE_DESKTOP: _authenticate_desktop,
+    AUTH_ROLE_DEVICE: _authenticate_device,
+}
 
 
 async def _authenticate_connection(
-    nonce: str,
+    nonce: bytes,
     msg: dict[str, object],
-) -> tuple[bool, str | None, str, str | None]:
+) -> _AuthOutcome:
     auth = _auth_manager
     if auth is None:
         return False, None, "auth not configured", None
@@ -189,53 +317,17 @@ async def _authenticate_connection(
     if not isinstance(mode, str):
         return False, None, "auth_mode is required", None
 
-    if mode == AUTH_ROLE_DESKTOP:
-        device_id = msg.get("device_id")
-        signature = msg.get("nonce_signature") or msg.get("signature")
-        if not isinstance(device_id, str) or not device_id:
-            return False, None, "desktop auth requires device_id", None
-        if not isinstance(signature, str) or not signature:
-            return False, None, "desktop auth requires nonce_signature", None
-        result = auth.verify_desktop_auth(
-            nonce_hex=nonce,
-            nonce_signature_b64=signature,
-        )
-        return (
-            result.ok,
-            device_id if result.ok else None,
-            result.reason or "auth failed",
-            AUTH_ROLE_DESKTOP,
-        )
-
-    if mode == AUTH_ROLE_DEVICE:
-        attestation = msg.get("attestation")
-        nonce_signature = msg.get("nonce_signature") or msg.get("signature")
-        if not isinstance(attestation, dict):
-            return False, None, "device auth requires attestation object", None
-        if not isinstance(nonce_signature, str) or not nonce_signature:
-            return False, None, "device auth requires nonce_signature", None
-        blob = attestation.get("blob")
-        desktop_signature = attestation.get("desktop_signature")
-        if not isinstance(blob, str) or not blob:
-            return False, None, "attestation.blob is required", None
-        if not isinstance(desktop_signature, str) or not desktop_signature:
-            return False, None, "attestation.desktop_signature is required", None
-        result = auth.verify_device_auth(
-            nonce_hex=nonce,
-            attestation_blob=blob,
-            desktop_signature_b64=desktop_signature,
-            nonce_signature_b64=nonce_signature,
-        )
-        return result.ok, result.device_id, result.reason or "auth failed", "device"
-
-    return False, None, f"unsupported auth_mode: {mode}", None
+    handler = _AUTH_HANDLERS.get(mode)
+    if handler is None:
+        return False, None, f"unsupported auth_mode: {mode}", None
+    return await handler(auth, nonce, msg)
 
 
 async def _register_desktop_ws(ws: ServerConnection) -> None:
     global _desktop_ws
     async with _pairing_lock:
         _desktop_ws = ws
-    _write_desktop_connected()
+    await _write_desktop_connected()
 
 
 async def _unregister_desktop_ws(ws: ServerConnection) -> None:
@@ -243,7 +335,7 @@ async def _unregister_desktop_ws(ws: ServerConnection) -> None:
     async with _pairing_lock:
         if _desktop_ws is ws:
             _desktop_ws = None
-    _write_desktop_disconnected()
+    await _write_desktop_disconnected()
 
 
 async def _get_desktop_ws() -> ServerConnection | None:
@@ -281,8 +373,12 @@ async def _forward_pairing_request(ws: ServerConnection, msg: dict[str, object])
     if isinstance(device_name, str) and device_name:
         forward_payload["device_name"] = device_name
 
-    await desktop_ws.send(json.dumps(forward_payload))
-    await ws.send(json.dumps({"type": "pairing_pending", "request_id": request_id}))
+    # Binary to the desktop plugin, text to the device app.
+    await desktop_ws.send(json_dumps(forward_payload))
+    await ws.send(
+        _PAIRING_PENDING_PREFIX + request_id.encode("ascii") + _FRAME_STRING_SUFFIX,
+        text=True,
+    )
 
     try:
         await asyncio.wait_for(ws.wait_closed(), timeout=PAIRING_WAIT_SECONDS)
@@ -298,7 +394,7 @@ async def _handle_pairing_response_from_desktop(msg: dict[str, object]) -> None:
     if not isinstance(request_id, str) or not request_id:
         log.warning("Ignoring pairing_response without request_id")
         return
-    if not isinstance(status, str) or status not in {"approved", "rejected"}:
+    if not isinstance(status, str) or status not in _PAIRING_STATUSES:
         log.warning("Ignoring pairing_response with invalid status")
         return
 
@@ -324,28 +420,39 @@ async def _handle_pairing_response_from_desktop(msg: dict[str, object]) -> None:
         outbound["reason"] = reason if isinstance(reason, str) and reason else "rejected"
 
     try:
-        await pending_ws.send(json.dumps(outbound))
+        await pending_ws.send(json_dumps(outbound), text=True)
     finally:
         await pending_ws.close(code=WS_CLOSE_NORMAL, reason="pairing complete")
 
 
 async def handle_connection(ws: ServerConnection) -> None:
     """Handle a single WebSocket connection lifetime."""
+    # Hex only on the wire (clients sign the hex-decoded bytes); verification
+    # uses the raw bytes directly.
     nonce = generate_nonce()
-    await ws.send(json.dumps({"type": "auth_challenge", "nonce": nonce}))
+    # Text frame: the peer's role (desktop or device app) is not known yet.
+    # hexlify yields ASCII bytes directly, skipping the bytes.hex() str and
+    # its re-encode before splicing into the byte template.
+    await ws.send(
+        _AUTH_CHALLENGE_PREFIX + binascii.hexlify(nonce) + _FRAME_STRING_SUFFIX,
+        text=True,
+    )
 
     try:
-        raw = await asyncio.wait_for(ws.recv(), timeout=AUTH_TIMEOUT_SECONDS)
-    except asyncio.TimeoutError:
+        async with asyncio.timeout(AUTH_TIMEOUT_SECONDS):
+            raw = await ws.recv()
+    except TimeoutError:
         log.warning("Auth rejected", reason="timeout")
         await ws.close(code=WS_CLOSE_AUTH_FAILED, reason="auth timeout")
         return
     except websockets.ConnectionClosed:
         return
 
+    # The desktop plugin sends binary JSON frames and device apps send text;
+    # json_loads accepts both, whereas str(bytes) would yield "b'...'".
     try:
-        first_msg = json.loads(str(raw))
-    except json.JSONDecodeError:
+        first_msg = json_loads(raw)
+    except JSONDecodeError:
         log.warning("Auth rejected", reason="first message invalid JSON")
         await ws.close(code=WS_CLOSE_AUTH_FAILED, reason="invalid json")
         return
@@ -363,11 +470,11 @@ async def handle_connection(ws: ServerConnection) -> None:
         log.warning("Auth rejected", reason=reason)
         # Record auth errors for desktop role so the dashboard can surface them.
         if first_msg.get("auth_mode") == AUTH_ROLE_DESKTOP:
-            _write_auth_error(reason)
+            await _write_auth_error(reason)
         await ws.close(code=WS_CLOSE_AUTH_FAILED, reason=reason[:WS_REASON_MAX_LENGTH])
         return
 
-    await ws.send(json.dumps({"type": "auth_ok", "device_id": device_id}))
+    await ws.send(json_dumps({"type": "auth_ok", "device_id": device_id}), text=True)
     log.info("Device authenticated", device_id=device_id, role=role)
 
     is_desktop = role == AUTH_ROLE_DESKTOP
@@ -376,16 +483,24 @@ async def handle_connection(ws: ServerConnection) -> None:
     if is_desktop:
         await _register_desktop_ws(ws)
     try:
+        # Frames are relayed one at a time, in order. websockets has no public
+        # non-blocking receive to drain a batch, and a buffered frame is
+        # returned without suspending. Unicast skips the registry lock, so
+        # batching would save little and could reorder per-recipient delivery.
         async for message in ws:
-            if is_desktop:
-                try:
-                    maybe = json.loads(str(message))
-                except json.JSONDecodeError:
-                    maybe = None
-                if isinstance(maybe, dict) and maybe.get("type") == "pairing_response":
-                    await _handle_pairing_response_from_desktop(maybe)
-                    continue
-            await relay_message(device_id, message)
+            # Parse once here; relay_message reuses the dict for routing.
+            try:
+                msg = json_loads(message)
+            except JSONDecodeError:
+                log.warning("Non-JSON message ignored", sender_id=device_id)
+                continue
+            if not isinstance(msg, dict):
+                log.warning("Non-object message ignored", sender_id=device_id)
+                continue
+            if is_desktop and msg.get("type") == "pairing_response":
+                await _handle_pairing_response_from_desktop(msg)
+                continue
+            await relay_message(device_id, message, msg)
     except websockets.ConnectionClosed:
         pass
     finally:
@@ -56,7 +56,9 @@ class ChannelPlugin(ABC):
         """Forward an inbound message from the third party to hirocli.
 
         Call this from your polling loop or webhook handler whenever a new
-        message arrives from the external service.
+        message arrives from the external service. High-rate channels can
+        build *message* with ``UnifiedMessage.fast(...)``, which skips
+        validation and so must only be fed trusted, well-typed values.
         """
         if self._emit_callback is not None:
             await self._emit_callback(message)
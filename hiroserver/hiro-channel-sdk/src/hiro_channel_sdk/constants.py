@@ -14,6 +14,8 @@ from __future__ import annotations
 JSONRPC_VERSION: str = "2.0"
 JSONRPC_ERROR_METHOD_NOT_FOUND: int = -32601
 JSONRPC_ERROR_INTERNAL: int = -32603
+# How long PluginTransport.request() waits for hirocli's response.
+RPC_REQUEST_TIMEOUT_SECONDS: float = 30.0
 
 # ---------------------------------------------------------------------------
 # Channel RPC methods
@@ -58,5 +60,10 @@ CONTENT_TYPE_JSON: str = "json"
 # ---------------------------------------------------------------------------
 
 RECONNECT_DELAY_SECONDS: float = 5.0
-RECONNECT_BACKOFF_BASE: float = 1.0
+# Truncated exponential backoff with jitter, matching websockets' reference
+# reconnect algorithm: first retry after random() * INITIAL, then MIN growing
+# by FACTOR up to MAX.
+RECONNECT_BACKOFF_INITIAL: float = 5.0
+RECONNECT_BACKOFF_MIN: float = 1.92
+RECONNECT_BACKOFF_FACTOR: float = 1.618
 RECONNECT_BACKOFF_MAX: float = 60.0
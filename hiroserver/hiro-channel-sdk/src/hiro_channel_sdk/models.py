@@ -32,6 +32,38 @@ class UnifiedMessage(BaseModel):
         default_factory=lambda: datetime.now(timezone.utc)
     )
 
+    @classmethod
+    def fast(
+        cls,
+        *,
+        channel: str,
+        direction: str,
+        sender_id: str,
+        body: str = "",
+        recipient_id: str | None = None,
+        content_type: str = CONTENT_TYPE_TEXT,
+        metadata: dict[str, Any] | None = None,
+        id: str | None = None,
+        timestamp: datetime | None = None,
+    ) -> UnifiedMessage:
+        """Build a message without Pydantic validation.
+
+        For high-rate plugin code whose inputs are already well-typed. Pass
+        ``id``/``timestamp`` when the caller already has them (e.g. from the
+        third-party payload) to skip generating new ones.
+        """
+        return cls.model_construct(
+            id=id if id is not None else uuid4().hex,
+            channel=channel,
+            direction=direction,
+            sender_id=sender_id,
+            recipient_id=recipient_id,
+            content_type=content_type,
+            body=body,
+            metadata=metadata if metadata is not None else {},
+            timestamp=timestamp if timestamp is not None else datetime.now(timezone.utc),
+        )
+
 
 class RpcRequest(BaseModel):
     """JSON-RPC 2.0 request or notification (notification when id is None)."""
@@ -2,42 +2,84 @@
 
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 from typing import Any
 from uuid import uuid4
 
+from hiro_commons.encoding import json_dumps, json_loads
+
+from .constants import JSONRPC_VERSION
 from .models import RpcRequest, RpcResponse
 
 # ---------------------------------------------------------------------------
 # Builders
+#
+# Frames are fixed-shape, so the envelope is spliced from pre-encoded byte
+# fragments and only the variable members go through orjson: no envelope
+# dict, and no RpcRequest/RpcResponse whose fields we just set.
+# Key order and null members match the models' model_dump_json() output.
+# The UTF-8 bytes are sent as-is (a binary frame); both ends parse either
+# frame type, so there is no bytes -> str decode per frame. Fragments are
+# joined in one allocation (b"".join), not by chained + which copies the
+# growing prefix at every step.
 # ---------------------------------------------------------------------------
 
+_JSONRPC_PREFIX = b'{"jsonrpc":' + json_dumps(JSONRPC_VERSION)
+_SUCCESS_PREFIX = _JSONRPC_PREFIX + b',"result":'
+_EMPTY_PARAMS = b"{}"
+
+
+@lru_cache(maxsize=64)
+def _method_prefix(method: str) -> bytes:
+    """``{"jsonrpc":"2.0","method":"<method>","params":`` for *method*."""
+    return _JSONRPC_PREFIX + b',"method":' + json_dumps(method) + b',"params":'
+
 
 def build_request(
     method: str,
     params: dict[str, Any] | None = None,
     *,
-    request_id: str | None = None,
-) -> str:
+    request_id: str | int | None = None,
+) -> bytes:
     """Serialise a JSON-RPC request (expects a response)."""
-    return RpcRequest(
-        method=method,
-        params=params or {},
-        id=request_id or uuid4().hex,
-    ).model_dump_json()
+    return b"".join(
+        (
+            _method_prefix(method),
+            json_dumps(params) if params else _EMPTY_PARAMS,
+            b',"id":',
+            json_dumps(request_id if request_id is not None else uuid4().hex),
+            b"}",
+        )
+    )
 
 
 def build_notification(
     method: str,
     params: dict[str, Any] | None = None,
-) -> str:
+) -> bytes:
     """Serialise a JSON-RPC notification (fire-and-forget, no id)."""
-    return RpcRequest(method=method, params=params or {}, id=None).model_dump_json()
+    return build_notification_json(method, json_dumps(params) if params else _EMPTY_PARAMS)
+
 
+def build_notification_json(method: str, params_json: bytes) -> bytes:
+    """Serialise a notification whose *params* are already JSON-encoded.
 
-def build_success(result: Any, request_id: str | int | None = None) -> str:
+    Lets callers holding a model use its compiled serializer instead of
+    building a dict first.
+    """
+    return b"".join((_method_prefix(method), params_json, b',"id":null}'))
+
+
+def build_success(result: Any, request_id: str | int | None = None) -> bytes:
     """Serialise a successful JSON-RPC response."""
-    return RpcResponse(result=result, id=request_id).model_dump_json()
+    return build_success_json(json_dumps(result), request_id)
+
+
+def build_success_json(result_json: bytes, request_id: str | int | None = None) -> bytes:
+    """Serialise a successful response whose *result* is already JSON-encoded."""
+    return b"".join(
+        (_SUCCESS_PREFIX, result_json, b',"error":null,"id":', json_dumps(request_id), b"}")
+    )
 
 
 def build_error(
@@ -45,12 +87,16 @@ def build_error(
     message: str,
     request_id: str | int | None = None,
     data: Any = None,
-) -> str:
+) -> bytes:
     """Serialise a JSON-RPC error response."""
-    return RpcResponse(
-        error={"code": code, "message": message, "data": data},
-        id=request_id,
-    ).model_dump_json()
+    return json_dumps(
+        {
+            "jsonrpc": JSONRPC_VERSION,
+            "result": None,
+            "error": {"code": code, "message": message, "data": data},
+            "id": request_id,
+        }
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -58,9 +104,20 @@ def build_error(
 # ---------------------------------------------------------------------------
 
 
-def parse_message(raw: str) -> RpcRequest | RpcResponse:
-    """Deserialise a raw JSON string into the appropriate RPC model."""
-    data = json.loads(raw)
-    if "method" in data:
-        return RpcRequest.model_validate(data)
-    return RpcResponse.model_validate(data)
+def parse_message(raw: str | bytes, *, validate: bool = False) -> RpcRequest | RpcResponse:
+    """Deserialise a raw JSON frame into the appropriate RPC model.
+
+    By default the model is assembled with ``model_construct`` (no field
+    validation): dispatchers only read ``method``/``params``/``id``/``result``.
+    Pass ``validate=True`` where malformed frames must be rejected.
+
+    Raises ValueError (JSONDecodeError is a subclass) if *raw* is not a JSON
+    object.
+    """
+    data = json_loads(raw)
+    if not isinstance(data, dict):
+        raise ValueError(f"RPC frame must be a JSON object, got {type(data).__name__}")
+    model = RpcRequest if "method" in data else RpcResponse
+    if validate:
+        return model.model_validate(data)
+    return model.model_construct(**data)
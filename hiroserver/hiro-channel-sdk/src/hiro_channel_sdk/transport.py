@@ -18,12 +18,15 @@ The transport:
 from __future__ import annotations
 
 import asyncio
-import json
+import itertools
+from collections.abc import Awaitable, Callable
 from typing import Any
-from uuid import uuid4
 
 import websockets
+from pydantic_core import to_json
 from websockets.exceptions import ConnectionClosed
+from hiro_commons.constants.network import WS_MAX_QUEUE, WS_WRITE_LIMIT
+from hiro_commons.encoding import json_dumps
 from hiro_commons.log import Logger
 
 from . import rpc
@@ -39,8 +42,9 @@ from .constants import (
     METHOD_STATUS,
     METHOD_STOP,
     RECONNECT_DELAY_SECONDS,
+    RPC_REQUEST_TIMEOUT_SECONDS,
 )
-from .models import RpcRequest, RpcResponse, UnifiedMessage
+from .models import RpcRequest, UnifiedMessage
 
 log = Logger.get("TRANSPORT")
 
@@ -50,13 +54,38 @@ RECONNECT_DELAY = RECONNECT_DELAY_SECONDS
 class PluginTransport:
     """Manages the bidirectional JSON-RPC connection to hirocli."""
 
+    # Fixed attribute set: no per-instance __dict__, and the per-frame reads
+    # of _ws/_pending/_stop_event resolve through slot descriptors.
+    __slots__ = (
+        "_plugin",
+        "_url",
+        "_ws",
+        "_pending",
+        "_request_ids",
+        "_stop_event",
+        "_started",
+        "_status_json",
+    )
+
     def __init__(self, plugin: ChannelPlugin, hiro_ws_url: str) -> None:
         self._plugin = plugin
         self._url = hiro_ws_url
         self._ws: Any = None
-        self._pending: dict[str, asyncio.Future[Any]] = {}
+        self._pending: dict[int, asyncio.Future[Any]] = {}
+        # Ids only correlate responses within this process, so a counter
+        # replaces uuid4 (no urandom read, small int keys in _pending).
+        self._request_ids = itertools.count(1)
         self._stop_event = asyncio.Event()
         self._started = False
+        # channel.status never changes for the life of the transport, so its
+        # result is encoded once and spliced into each response.
+        self._status_json = json_dumps(
+            {
+                "name": plugin.info.name,
+                "version": plugin.info.version,
+                "status": "running",
+            }
+        )
 
     async def run(self) -> None:
         """Connect to hirocli, register, and run the message loop.
@@ -101,7 +130,14 @@ class PluginTransport:
             url=self._url,
             channel=self._plugin.info.name,
         )
-        async with websockets.connect(self._url) as ws:
+        # Loopback link to hirocli: permessage-deflate only burns CPU here, and
+        # the queue/write limits match the other Hiro sockets.
+        async with websockets.connect(
+            self._url,
+            max_queue=WS_MAX_QUEUE,
+            write_limit=WS_WRITE_LIMIT,
+            compression=None,
+        ) as ws:
             self._ws = ws
 
             await ws.send(
@@ -117,14 +153,19 @@ class PluginTransport:
             log.info("Channel registered with hirocli", channel=self._plugin.info.name)
 
             async def _forward_inbound(msg: UnifiedMessage) -> None:
-                await self._notify(METHOD_RECEIVE, msg.model_dump(mode="json"))
+                # pydantic's compiled serializer writes the JSON bytes in one
+                # pass, skipping the intermediate model_dump() dict.
+                if self._ws is not None:
+                    await self._ws.send(
+                        rpc.build_notification_json(METHOD_RECEIVE, to_json(msg))
+                    )
 
             self._plugin._emit_callback = _forward_inbound
             self._plugin._event_callback = self._notify_event
 
             try:
                 async for raw in ws:
-                    await self._handle_frame(str(raw))
+                    await self._handle_frame(raw)
             except ConnectionClosed:
                 pass
             finally:
@@ -134,75 +175,52 @@ class PluginTransport:
                 self._plugin._emit_callback = None
                 self._plugin._event_callback = None
                 self._ws = None
+                # Responses can't arrive on a new connection; fail waiters now.
+                for fut in self._pending.values():
+                    if not fut.done():
+                        fut.set_exception(ConnectionError("Disconnected from hirocli"))
+                self._pending.clear()
 
     # ------------------------------------------------------------------
     # Incoming frame dispatch
     # ------------------------------------------------------------------
 
-    async def _handle_frame(self, raw: str) -> None:
+    async def _handle_frame(self, raw: str | bytes) -> None:
+        # Parsed straight from the frame: json_loads takes str or bytes, so
+        # binary frames need no str() copy (which would also mangle them).
+        # hirocli is the only peer, so envelopes are built without a second
+        # validation pass over the already-decoded dict.
         try:
-            data = json.loads(raw)
-        except json.JSONDecodeError:
-            log.warning("Invalid JSON from hirocli", raw=raw[:200])
+            msg = rpc.parse_message(raw)
+        except ValueError as exc:
+            # Invalid JSON or a non-object frame: skip it rather than let the
+            # exception end the connection loop.
+            log.warning("Invalid frame from hirocli", error=str(exc), raw=raw[:200])
             return
 
-        if "method" in data:
-            req = RpcRequest.model_validate(data)
-            await self._dispatch(req)
+        if isinstance(msg, RpcRequest):
+            await self._dispatch(msg)
         else:
-            resp = RpcResponse.model_validate(data)
-            fut = self._pending.pop(str(resp.id), None)
+            fut = self._pending.pop(msg.id, None)
             if fut and not fut.done():
-                if resp.error:
-                    fut.set_exception(RuntimeError(resp.error["message"]))
+                if msg.error:
+                    fut.set_exception(RuntimeError(msg.error["message"]))
                 else:
-                    fut.set_result(resp.result)
+                    fut.set_result(msg.result)
 
     async def _dispatch(self, req: RpcRequest) -> None:
         result: Any = None
         error: dict[str, Any] | None = None
 
+        handler = self._HANDLERS.get(req.method)
         try:
-            match req.method:
-                case _ if req.method == METHOD_SEND:
-                    msg = UnifiedMessage.model_validate(req.params)
-                    await self._plugin.send(msg)
-                    result = {"ok": True}
-
-                case _ if req.method == METHOD_CONFIGURE:
-                    await self._plugin.on_configure(req.params.get("config", {}))
-                    if not self._started:
-                        await self._plugin.on_start()
-                        self._started = True
-                    result = {"ok": True}
-
-                case _ if req.method == METHOD_EVENT:
-                    event = req.params.get("event")
-                    data = req.params.get("data", {})
-                    if not isinstance(event, str) or not event:
-                        raise ValueError(f"{METHOD_EVENT} requires params.event")
-                    if not isinstance(data, dict):
-                        raise ValueError(f"{METHOD_EVENT} params.data must be an object")
-                    await self._plugin.on_event(event, data)
-                    result = {"ok": True}
-
-                case _ if req.method == METHOD_STOP:
-                    self._stop_event.set()
-                    result = {"ok": True}
-
-                case _ if req.method == METHOD_STATUS:
-                    result = {
-                        "name": self._plugin.info.name,
-                        "version": self._plugin.info.version,
-                        "status": "running",
-                    }
-
-                case _:
-                    error = {
-                        "code": JSONRPC_ERROR_METHOD_NOT_FOUND,
-                        "message": f"Method not found: {req.method}",
-                    }
-
+            if handler is None:
+                error = {
+                    "code": JSONRPC_ERROR_METHOD_NOT_FOUND,
+                    "message": f"Method not found: {req.method}",
+                }
+            else:
+                result = await handler(self, req.params)
         except Exception as exc:
             log.error(
                 "Error handling RPC method",
@@ -212,13 +230,66 @@ class PluginTransport:
             )
             error = {"code": JSONRPC_ERROR_INTERNAL, "message": str(exc)}
 
+        # One send per response, deliberately: ws.send(iterable) would emit
+        # the frames as fragments of a single message, and the connection's
+        # transport already buffers back-to-back writes, so an outbox/flush
+        # task would only add latency.
         if req.id is not None and self._ws is not None:
             if error:
                 await self._ws.send(
                     rpc.build_error(error["code"], error["message"], req.id)
                 )
             else:
-                await self._ws.send(rpc.build_success(result, req.id))
+                # Handlers may return an already-encoded result as bytes
+                # (a JSON result can never itself be bytes).
+                if isinstance(result, bytes):
+                    await self._ws.send(rpc.build_success_json(result, req.id))
+                else:
+                    await self._ws.send(rpc.build_success(result, req.id))
+
+    # ------------------------------------------------------------------
+    # RPC method handlers (hirocli -> plugin)
+    # ------------------------------------------------------------------
+
+    async def _rpc_send(self, params: dict[str, Any]) -> Any:
+        msg = UnifiedMessage.model_validate(params)
+        await self._plugin.send(msg)
+        return {"ok": True}
+
+    async def _rpc_configure(self, params: dict[str, Any]) -> Any:
+        await self._plugin.on_configure(params.get("config", {}))
+        if not self._started:
+            await self._plugin.on_start()
+            self._started = True
+        return {"ok": True}
+
+    async def _rpc_event(self, params: dict[str, Any]) -> Any:
+        event = params.get("event")
+        data = params.get("data", {})
+        if not isinstance(event, str) or not event:
+            raise ValueError(f"{METHOD_EVENT} requires params.event")
+        if not isinstance(data, dict):
+            raise ValueError(f"{METHOD_EVENT} params.data must be an object")
+        await self._plugin.on_event(event, data)
+        return {"ok": True}
+
+    async def _rpc_stop(self, params: dict[str, Any]) -> Any:
+        self._stop_event.set()
+        return {"ok": True}
+
+    async def _rpc_status(self, params: dict[str, Any]) -> Any:
+        return self._status_json
+
+    # method -> handler; one hash lookup per frame instead of a guard chain.
+    _HANDLERS: dict[
+        str, Callable[[PluginTransport, dict[str, Any]], Awaitable[Any]]
+    ] = {
+        METHOD_SEND: _rpc_send,
+        METHOD_CONFIGURE: _rpc_configure,
+        METHOD_EVENT: _rpc_event,
+        METHOD_STOP: _rpc_stop,
+        METHOD_STATUS: _rpc_status,
+    }
 
     # ------------------------------------------------------------------
     # Outgoing helpers
@@ -237,11 +308,17 @@ class PluginTransport:
         """Send a JSON-RPC request to hirocli and await the response."""
         if self._ws is None:
             raise RuntimeError("Not connected to hirocli")
-        request_id = uuid4().hex
+        request_id = next(self._request_ids)
         loop = asyncio.get_running_loop()
         fut: asyncio.Future[Any] = loop.create_future()
         self._pending[request_id] = fut
-        await self._ws.send(
-            rpc.build_request(method, params or {}, request_id=request_id)
-        )
-        return await fut
+        # The entry is always removed, so a response that never arrives
+        # (hirocli restarted mid-call) can't leak a future or hang the caller.
+        try:
+            await self._ws.send(
+                rpc.build_request(method, params or {}, request_id=request_id)
+            )
+            async with asyncio.timeout(RPC_REQUEST_TIMEOUT_SECONDS):
+                return await fut
+        finally:
+            self._pending.pop(request_id, None)
@@ -13,6 +13,7 @@ from cryptography.hazmat.primitives.asymmetric.ed25519 import (
 )
 
 from .constants.domain import DEFAULT_ATTESTATION_EXPIRY_DAYS
+from .encoding import JSONDecodeError, json_loads
 from .signing import sign_bytes, verify_signature
 from .timestamps import parse_iso8601_utc, utc_iso, utc_now
 
@@ -34,8 +35,12 @@ def create_device_attestation(
     device_id: str,
     device_public_key_b64: str,
     expires_days: int = DEFAULT_ATTESTATION_EXPIRY_DAYS,
-) -> dict[str, Any]:
-    """Create and sign a canonical device attestation blob."""
+) -> tuple[dict[str, Any], DeviceAttestation]:
+    """Create and sign a canonical device attestation blob.
+
+    Returns the wire payload (``blob`` + ``desktop_signature``) alongside the
+    claims it encodes, so callers don't re-parse the blob they just built.
+    """
     issued_at = utc_now()
     expires_at = issued_at + timedelta(days=expires_days)
     blob_obj = {
@@ -46,16 +51,33 @@ def create_device_attestation(
     }
     blob = json.dumps(blob_obj, separators=(",", ":"), sort_keys=True)
     signature = sign_bytes(private_key, blob.encode("utf-8"))
-    return {"blob": blob, "desktop_signature": signature}
+    # utc_iso keeps full precision, so these equal what parsing the blob gives.
+    claims = DeviceAttestation(
+        device_id=device_id,
+        device_public_key_b64=device_public_key_b64,
+        issued_at=issued_at,
+        expires_at=expires_at,
+        blob=blob,
+    )
+    return {"blob": blob, "desktop_signature": signature}, claims
 
 
 def parse_device_attestation_blob(attestation_blob: str) -> DeviceAttestation:
     """Parse and validate a device attestation blob JSON."""
+    return _build_attestation(_load_blob(attestation_blob), attestation_blob)
+
+
+def _load_blob(data: str | bytes) -> dict[str, Any]:
     try:
-        blob: dict[str, Any] = json.loads(attestation_blob)
-    except Exception as exc:
+        blob = json_loads(data)
+    except JSONDecodeError as exc:
         raise ValueError("attestation blob is not valid JSON") from exc
+    if not isinstance(blob, dict):
+        raise ValueError("attestation blob is not a JSON object")
+    return blob
+
 
+def _build_attestation(blob: dict[str, Any], attestation_blob: str) -> DeviceAttestation:
     device_id = blob.get("device_id")
     device_public_key_b64 = blob.get("device_public_key")
     issued_at = blob.get("issued_at")
@@ -97,10 +119,8 @@ def verify_device_attestation(
     desktop_signature_b64: str,
 ) -> DeviceAttestation:
     """Verify attestation signature and return validated attestation payload."""
-    if not verify_signature(
-        root_public_key,
-        attestation_blob.encode("utf-8"),
-        desktop_signature_b64,
-    ):
+    # Encode once: the same UTF-8 bytes are signed over and parsed by orjson.
+    blob_bytes = attestation_blob.encode("utf-8")
+    if not verify_signature(root_public_key, blob_bytes, desktop_signature_b64):
         raise ValueError("attestation signature invalid")
-    return parse_device_attestation_blob(attestation_blob)
+    return _build_attestation(_load_blob(blob_bytes), attestation_blob)
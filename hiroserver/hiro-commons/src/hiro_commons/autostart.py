@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import ctypes
+import functools
 import shutil
 import subprocess
 import sys
@@ -25,6 +26,10 @@ def _reg_run_key(entry_name_prefix: str, target_name: str) -> str:
     return f"{entry_name_prefix}-{target_name}"
 
 
+# PATH scans are slow on Windows and the answer is stable for a process.
+# Failures raise and so are not cached: the long-lived UI process must see
+# an executable installed after a failed attempt.
+@functools.lru_cache(maxsize=8)
 def _resolve_executable(executable_name: str) -> str:
     exe = shutil.which(executable_name)
     if exe is None:
@@ -39,6 +44,11 @@ def _command_line(exe: str, launch_args: list[str]) -> str:
     return subprocess.list2cmdline([exe, *launch_args])
 
 
+# schtasks is a console program: without this flag each call from a GUI or
+# Task Scheduler context flashes (and pays for) a new console window.
+_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+
 def _schtasks_create(task_name: str, command_line: str, run_level: str = "LIMITED") -> bool:
     cmd = [
         "schtasks",
@@ -53,17 +63,28 @@ def _schtasks_create(task_name: str, command_line: str, run_level: str = "LIMITE
         run_level,
         "/F",
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    # Only the exit code is used, so nothing is piped back or decoded.
+    result = subprocess.run(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        creationflags=_NO_WINDOW,
+    )
     return result.returncode == 0
 
 
 def _schtasks_delete(task_name: str) -> bool:
+    # stderr stays raw bytes and is decoded only on failure, where the
+    # "does not exist" check needs it; stdout is never read.
     result = subprocess.run(
         ["schtasks", "/Delete", "/TN", task_name, "/F"],
-        capture_output=True,
-        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        creationflags=_NO_WINDOW,
     )
-    return result.returncode == 0 or "does not exist" in result.stderr.lower()
+    if result.returncode == 0:
+        return True
+    return "does not exist" in result.stderr.decode(errors="replace").lower()
 
 
 def _registry_create(reg_key: str, command_line: str) -> None:
@@ -28,6 +28,9 @@ from .network import (
     PORT_OFFSET_PLUGIN,
     PORT_RANGE_START,
     PORTS_PER_SLOT,
+    WS_MAX_QUEUE,
+    WS_PING_TIMEOUT_SECONDS,
+    WS_WRITE_LIMIT,
 )
 from .storage import (
     CONFIG_FILENAME,
@@ -62,6 +65,9 @@ __all__ = [
     "PORT_OFFSET_PLUGIN",
     "PORT_RANGE_START",
     "PORTS_PER_SLOT",
+    "WS_MAX_QUEUE",
+    "WS_PING_TIMEOUT_SECONDS",
+    "WS_WRITE_LIMIT",
     # storage
     "CONFIG_FILENAME",
     "CONVERSATIONS_DIR",
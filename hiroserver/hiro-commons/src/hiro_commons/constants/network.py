@@ -18,3 +18,11 @@ PORTS_PER_SLOT: int = 4
 PORT_OFFSET_HTTP: int = 0
 PORT_OFFSET_PLUGIN: int = 1
 PORT_OFFSET_ADMIN: int = 3
+
+# Gateway relay WebSocket tuning (applied on both the gateway server and the
+# devices plugin client). Frames are compact JSON, so permessage-deflate only
+# adds a compression copy per frame; max_size stays at websockets' 1 MiB
+# default so future media payloads still fit.
+WS_MAX_QUEUE: int = 32
+WS_WRITE_LIMIT: int = 64 * 1024
+WS_PING_TIMEOUT_SECONDS: float = 20.0
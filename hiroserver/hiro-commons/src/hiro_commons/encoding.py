@@ -3,13 +3,32 @@
 from __future__ import annotations
 
 import base64
+from typing import Any
 
+import orjson
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError (and ValueError).
+JSONDecodeError = orjson.JSONDecodeError
 
 def b64_encode(data: bytes) -> str:
     """Encode bytes to base64 ASCII."""
     return base64.b64encode(data).decode("ascii")
 
 
-def b64_decode(data: str) -> bytes:
-    """Decode base64 ASCII to bytes with strict validation."""
-    return base64.b64decode(data.encode("ascii"), validate=True)
+def b64_decode(data: str, *, validate: bool = True) -> bytes:
+    """Decode base64 ASCII to bytes, strictly unless *validate* is False.
+
+    Non-strict decoding skips the alphabet pre-scan; use it only where the
+    decoded bytes are checked anyway (e.g. signatures fed to Ed25519 verify).
+    """
+    return base64.b64decode(data.encode("ascii"), validate=validate)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialise *obj* to compact UTF-8 JSON bytes."""
+    return orjson.dumps(obj)
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON from either ``str`` or ``bytes`` without an extra copy."""
+    return orjson.loads(data)
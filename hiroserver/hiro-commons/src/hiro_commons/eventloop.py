@@ -0,0 +1,25 @@
+"""Event loop selection shared by Hiro service entry points."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    # uvloop is only a dependency on non-Windows platforms; fall back to the
+    # default selector/proactor loop wherever it is unavailable.
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Run *main* to completion on uvloop when available, like ``asyncio.run``."""
+    with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+        return runner.run(main)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from cryptography.hazmat.primitives.asymmetric.ed25519 import (
     Ed25519PrivateKey,
     Ed25519PublicKey,
@@ -29,8 +31,13 @@ def public_key_to_b64(public_key: Ed25519PublicKey) -> str:
     return b64_encode(raw)
 
 
+@lru_cache(maxsize=4096)
 def load_public_key_b64(public_key_b64: str) -> Ed25519PublicKey:
-    """Load an Ed25519 public key from base64 raw bytes."""
+    """Load an Ed25519 public key from base64 raw bytes.
+
+    Memoized: the gateway re-parses the same attested device keys on every
+    reconnect, and ``Ed25519PublicKey`` objects are immutable.
+    """
     raw = b64_decode(public_key_b64)
     if len(raw) != 32:
         raise ValueError("Ed25519 public key must be exactly 32 bytes")
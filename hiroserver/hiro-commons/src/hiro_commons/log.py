@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import atexit
 import contextvars
 import logging
 import logging.handlers
+import queue
 import sys
+import time
 import traceback
 from contextlib import contextmanager
 from typing import Mapping
@@ -55,7 +58,11 @@ _INDENT_LEVEL: contextvars.ContextVar[int] = contextvars.ContextVar(
 _INDENT_UNIT: str = "--"
 
 _FILE_SINKS: list[tuple[int, logging.Handler, object]] = []
+_SINK_LISTENERS: dict[logging.Handler, logging.handlers.QueueListener] = {}
 _LEVEL_OVERRIDES: dict[str, int] = {}
+# (epoch second, rendered "%H:%M:%S"); replaced as one tuple so threads that
+# log concurrently never see a second paired with another second's string.
+_TS_CACHE: tuple[int, str] = (-1, "")
 
 
 def _pick_module_color(name: str) -> str:
@@ -138,6 +145,18 @@ class _NullRenderer:
         raise structlog.DropEvent()
 
 
+def _add_timestamp(logger, method_name, event_dict):
+    """Local ``%H:%M:%S`` timestamp, re-rendered only when the second changes."""
+    global _TS_CACHE
+    sec = int(time.time())
+    cached_sec, text = _TS_CACHE
+    if sec != cached_sec:
+        text = time.strftime("%H:%M:%S", time.localtime(sec))
+        _TS_CACHE = (sec, text)
+    event_dict["ts"] = text
+    return event_dict
+
+
 def _module_level_filter(logger, method_name, event_dict):
     """Drop events below configured per-module level overrides."""
     if not _LEVEL_OVERRIDES:
@@ -222,6 +241,9 @@ class Logger:
 
     _DEFAULT_LEVEL = "INFO"
     _configured: bool = False
+    # True while only the implicit defaults from get() are in place; an
+    # explicit configure() call from an entry point may still replace them.
+    _implicit: bool = False
     _LEVELS: Mapping[str, int] = {
         name: level for name, level in logging._nameToLevel.items()
     }
@@ -244,7 +266,7 @@ class Logger:
         console: bool = True,
     ):
         """One-time global logger configuration."""
-        if cls._configured:
+        if cls._configured and not cls._implicit:
             return
 
         numeric_level = cls._determine_level(level)
@@ -264,7 +286,7 @@ class Logger:
             return event_dict
 
         processors = [
-            structlog.processors.TimeStamper(fmt="%H:%M:%S", utc=False, key="ts"),
+            _add_timestamp,
             structlog.processors.add_log_level,
             _add_module,
             _module_level_filter,
@@ -288,15 +310,22 @@ class Logger:
             cache_logger_on_first_use=True,
         )
         cls._configured = True
+        cls._implicit = False
 
     @classmethod
     def get(cls, name: str | None = None):
-        """Return a bound logger, auto-configuring with defaults if needed."""
+        """Return a bound logger, auto-configuring with defaults if needed.
+
+        The logger is a lazy proxy that resolves configuration on first use,
+        so module-level ``log = Logger.get(...)`` calls made at import time
+        honour the level/console settings the entry point configures later.
+        """
         if not cls._configured:
             cls.configure()
+            cls._implicit = True
         if name is None:
             return structlog.get_logger()
-        return structlog.get_logger(name).bind(module=name)
+        return structlog.get_logger(name, module=name)
 
     @classmethod
     def apply_level_overrides(cls, overrides: dict[str, str]) -> None:
@@ -354,10 +383,22 @@ class Logger:
 
         handler.setLevel(min_level)
         handler.setFormatter(logging.Formatter("%(message)s"))
+
+        # Callers (often the event loop thread) only enqueue; a listener
+        # thread does the file writes and rotation so disk I/O never stalls them.
+        sink_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(sink_queue)
+        queue_handler.setLevel(min_level)
+        listener = logging.handlers.QueueListener(
+            sink_queue, handler, respect_handler_level=True
+        )
+        listener.start()
+        _SINK_LISTENERS[queue_handler] = listener
+
         renderer = structlog.processors.JSONRenderer() if use_json else _PlainRenderer()
-        _FILE_SINKS.append((min_level, handler, renderer))
-        logging.getLogger().addHandler(handler)
-        return handler
+        _FILE_SINKS.append((min_level, queue_handler, renderer))
+        logging.getLogger().addHandler(queue_handler)
+        return queue_handler
 
     @classmethod
     def remove_file_sink(cls, handler: logging.Handler):
@@ -367,6 +408,9 @@ class Logger:
             pass
         global _FILE_SINKS
         _FILE_SINKS = [(lvl, h, r) for (lvl, h, r) in _FILE_SINKS if h is not handler]
+        listener = _SINK_LISTENERS.pop(handler, None)
+        if listener is not None:
+            listener.stop()
 
     @classmethod
     def set_indent_unit(cls, unit: str):
@@ -391,6 +435,18 @@ class Logger:
             _INDENT_LEVEL.reset(token)
 
 
+def _stop_sink_listeners() -> None:
+    """Flush queued records to their files at interpreter exit."""
+    for listener in list(_SINK_LISTENERS.values()):
+        try:
+            listener.stop()
+        except Exception:
+            pass
+    _SINK_LISTENERS.clear()
+
+
+atexit.register(_stop_sink_listeners)
+
 configure = Logger.configure
 get_logger = Logger.get
 set_level = Logger.set_level
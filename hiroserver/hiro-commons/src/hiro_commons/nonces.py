@@ -7,6 +7,10 @@ import secrets
 from .constants.domain import NONCE_BYTE_LENGTH
 
 
-def generate_nonce() -> str:
-    """Create a random challenge nonce encoded as hex."""
-    return secrets.token_hex(NONCE_BYTE_LENGTH)
+def generate_nonce() -> bytes:
+    """Create a random challenge nonce as raw bytes.
+
+    Callers hex-encode it once for the wire and keep the bytes for signature
+    verification, so the handshake never has to decode the hex again.
+    """
+    return secrets.token_bytes(NONCE_BYTE_LENGTH)
@@ -13,9 +13,11 @@ Design principles:
 from __future__ import annotations
 
 import os
+import shutil
 import signal
 import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
 
@@ -25,7 +27,10 @@ except ModuleNotFoundError:
     import tomli as tomllib  # type: ignore[no-redef]
 
 
-_workspace_root_cache: Path | None = None
+# Lookup results keyed by the resolved start path, misses included: callers
+# such as `channel setup` run from outside any workspace and would otherwise
+# re-walk to the filesystem root on every call.
+_workspace_root_cache: dict[Path, Path | None] = {}
 
 
 def find_workspace_root(start: Path | None = None) -> Path | None:
@@ -33,24 +38,34 @@ def find_workspace_root(start: Path | None = None) -> Path | None:
     root — the directory containing ``pyproject.toml`` with ``[tool.uv.workspace]``.
 
     Returns None if no workspace root is found.
-    The result is cached after the first successful lookup.
+    The result is cached per starting path.
     """
-    global _workspace_root_cache
-    if _workspace_root_cache is not None:
-        return _workspace_root_cache
-
     current = (start or Path(__file__)).resolve()
+    try:
+        return _workspace_root_cache[current]
+    except KeyError:
+        pass
+
+    found: Path | None = None
     for candidate in [current, *current.parents]:
         toml = candidate / "pyproject.toml"
-        if toml.exists():
-            try:
-                data = tomllib.loads(toml.read_text(encoding="utf-8"))
-                if "workspace" in data.get("tool", {}).get("uv", {}):
-                    _workspace_root_cache = candidate
-                    return candidate
-            except Exception:
-                pass
-    return None
+        try:
+            raw = toml.read_bytes()
+        except OSError:
+            continue
+        # Cheap pre-filter: a file without the word cannot declare a
+        # workspace, so unrelated pyproject files skip the TOML parse.
+        if b"workspace" not in raw:
+            continue
+        try:
+            data = tomllib.loads(raw.decode("utf-8"))
+        except Exception:
+            continue
+        if "workspace" in data.get("tool", {}).get("uv", {}):
+            found = candidate
+            break
+    _workspace_root_cache[current] = found
+    return found
 
 
 def uv_python_cmd() -> list[str]:
@@ -80,6 +95,9 @@ def spawn_detached(
     own PID via write_pid().  Use wait_for_pid() to wait for it.
     """
     effective_env = env if env is not None else dict(os.environ)
+    if sys.platform == "linux":
+        _posix_spawn_detached(cmd, effective_env, stderr_log)
+        return
     stderr_target = open(stderr_log, "a") if stderr_log else subprocess.DEVNULL  # noqa: SIM115
     if sys.platform == "win32":
         subprocess.Popen(
@@ -95,16 +113,51 @@ def spawn_detached(
             stderr=stderr_target,
         )
     else:
+        # No close_fds scan: Python opens every fd non-inheritable (PEP 446),
+        # and the launching CLI holds nothing else worth closing.
         subprocess.Popen(
             cmd,
             env=effective_env,
             start_new_session=True,
-            close_fds=True,
+            close_fds=False,
             stdout=subprocess.DEVNULL,
             stderr=stderr_target,
         )
 
 
+def _posix_spawn_detached(cmd: list[str], env: dict[str, str], stderr_log: Path | None) -> None:
+    """Linux fast path for spawn_detached.
+
+    The parent keeps nothing of the child, so fork+exec's page-table copy is
+    pure overhead; glibc's posix_spawn uses vfork semantics instead. The
+    child opens the stderr log itself, so the parent holds no handle to it.
+    """
+    stderr_action = (
+        (os.POSIX_SPAWN_OPEN, 2, str(stderr_log), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        if stderr_log
+        else (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0)
+    )
+    # Resolved against the child's PATH, as Popen(env=...) does; posix_spawnp
+    # would search the parent's PATH instead.
+    executable = shutil.which(cmd[0], path=os.pathsep.join(os.get_exec_path(env)))
+    if executable is None:
+        raise FileNotFoundError(f"Executable not found on PATH: {cmd[0]!r}")
+    pid = os.posix_spawn(
+        executable,
+        cmd,
+        env,
+        file_actions=[
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            stderr_action,
+        ],
+        setsid=True,
+    )
+    # Popen reaped abandoned children lazily; a bare pid needs its own reaper
+    # or long-lived callers (the admin UI restarting servers) collect zombies
+    # that is_running() would still report as alive.
+    threading.Thread(target=os.waitpid, args=(pid, 0), daemon=True).start()
+
+
 def wait_for_pid(
     base_path: Path,
     pid_filename: str,
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from functools import lru_cache
 
 
 def utc_now() -> datetime:
@@ -15,10 +16,19 @@ def utc_iso(value: datetime) -> str:
     return value.astimezone(UTC).isoformat().replace("+00:00", "Z")
 
 
+@lru_cache(maxsize=1024)
 def parse_iso8601_utc(value: str) -> datetime:
-    """Parse an ISO 8601 timestamp and normalize to UTC."""
-    normalized = value.replace("Z", "+00:00")
-    dt = datetime.fromisoformat(normalized)
+    """Parse an ISO 8601 timestamp and normalize to UTC.
+
+    Memoized: attestation blobs are re-presented on every device reconnect
+    during their validity window, and datetimes are immutable.
+    """
+    # fromisoformat accepts a trailing "Z" natively since Python 3.11 and is
+    # implemented in C, so a hand-rolled slice parser would only be slower.
+    dt = datetime.fromisoformat(value)
     if dt.tzinfo is None:
         raise ValueError("timestamp must include timezone")
+    # "Z"/"+00:00" already parse to the UTC singleton (what utc_iso writes).
+    if dt.tzinfo is UTC:
+        return dt
     return dt.astimezone(UTC)
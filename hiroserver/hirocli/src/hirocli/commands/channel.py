@@ -7,16 +7,14 @@ the corresponding Tool class in tools/channel.py.
 
 from __future__ import annotations
 
-import json
-import urllib.request
 from pathlib import Path
 from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
 from hiro_commons.constants.domain import MANDATORY_CHANNEL_NAME
+from hiro_commons.encoding import json_loads
 
 from ..domain.channel_config import load_channel_config
 from ..domain.workspace import WorkspaceError, resolve_workspace
@@ -53,6 +51,8 @@ def register(channel_app: typer.Typer, console: Console) -> None:
             )
             return
 
+        from rich.table import Table
+
         table = Table(title="Channel plugins", show_header=True)
         table.add_column("Name", style="bold")
         table.add_column("Enabled")
@@ -209,21 +209,33 @@ def register(channel_app: typer.Typer, console: Console) -> None:
         from ..domain.config import load_config
         config = load_config(workspace_path)
         url = f"http://{config.http_host}:{config.http_port}/channels"
+        # Plain http.client GET: urllib's opener chain (proxy discovery,
+        # cookie and redirect handlers) is pure overhead for a local server.
+        import http.client
+
+        conn = http.client.HTTPConnection(config.http_host, config.http_port, timeout=3)
         try:
-            with urllib.request.urlopen(url, timeout=3) as resp:  # noqa: S310
-                data = json.loads(resp.read())
+            conn.request("GET", "/channels")
+            resp = conn.getresponse()
+            if resp.status != 200:
+                raise RuntimeError(f"HTTP {resp.status} {resp.reason}")
+            data = json_loads(resp.read())
         except Exception as exc:
             console.print(
                 f"[red]Could not reach hirocli server at {url}: {exc}[/red]\n"
                 "[dim]Is hirocli running? Try [bold]hirocli status[/bold].[/dim]"
             )
             raise typer.Exit(1)
+        finally:
+            conn.close()
 
         channels: list[dict[str, str]] = data.get("channels", [])
         if not channels:
             console.print("[dim]No channel plugins currently connected.[/dim]")
             return
 
+        from rich.table import Table
+
         table = Table(title="Connected channels", show_header=True)
         table.add_column("Name", style="bold")
         table.add_column("Version")
@@ -6,7 +6,6 @@ from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
 from ..tools.device import DeviceAddTool, DeviceListTool, DeviceRevokeTool
 from ..domain.workspace import WorkspaceError
@@ -65,6 +64,8 @@ def register(device_app: typer.Typer, console: Console) -> None:
             console.print("[dim]No approved devices yet.[/dim]")
             return
 
+        from rich.table import Table
+
         table = Table(title="Approved devices", show_header=True)
         table.add_column("Name", style="bold")
         table.add_column("Device ID")
@@ -1,4 +1,9 @@
-"""Root CLI command registrations."""
+"""Root CLI command registrations.
+
+Server tools are imported inside each command: tools.server pulls in
+cryptography, autostart and the process helpers, which `hirocli device`,
+`channel` and `workspace` invocations never need.
+"""
 
 from __future__ import annotations
 
@@ -7,17 +12,7 @@ from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
-
-from ..tools.server import (
-    RestartTool,
-    SetupTool,
-    StartTool,
-    StatusTool,
-    StopTool,
-    TeardownTool,
-    UninstallTool,
-)
+
 from ..domain.workspace import WorkspaceError
 
 
@@ -69,6 +64,8 @@ def register(app: typer.Typer, console: Console) -> None:
                 default=default_gw,
             )
 
+        from ..tools.server import SetupTool
+
         try:
             result = SetupTool().execute(
                 gateway_url=effective_gateway_url,
@@ -137,6 +134,8 @@ def register(app: typer.Typer, console: Console) -> None:
         ),
     ) -> None:
         """Start the hirocli server (background by default, foreground with -f)."""
+        from ..tools.server import StartTool
+
         try:
             result = StartTool().execute(workspace=workspace, foreground=foreground, admin=admin)
         except ValueError as exc:
@@ -166,6 +165,8 @@ def register(app: typer.Typer, console: Console) -> None:
         ),
     ) -> None:
         """Stop the running hirocli server."""
+        from ..tools.server import StopTool
+
         try:
             result = StopTool().execute(workspace=workspace)
         except WorkspaceError as exc:
@@ -196,6 +197,8 @@ def register(app: typer.Typer, console: Console) -> None:
         ),
     ) -> None:
         """Gracefully restart the hirocli server (stop + start)."""
+        from ..tools.server import RestartTool
+
         try:
             result = RestartTool().execute(
                 workspace=workspace, foreground=foreground, admin=admin,
@@ -232,6 +235,8 @@ def register(app: typer.Typer, console: Console) -> None:
         ),
     ) -> None:
         """Show server and WebSocket connection status."""
+        from ..tools.server import StatusTool
+
         try:
             result = StatusTool().execute(workspace=workspace)
         except WorkspaceError as exc:
@@ -261,6 +266,8 @@ def register(app: typer.Typer, console: Console) -> None:
         """Stop server and remove all auto-start registrations for a workspace."""
         console.print("[bold cyan]hirocli teardown[/bold cyan]")
 
+        from ..tools.server import TeardownTool
+
         try:
             result = TeardownTool().execute(
                 workspace=workspace,
@@ -292,6 +299,8 @@ def register(app: typer.Typer, console: Console) -> None:
         """Stop server, remove auto-start, then print package uninstall commands."""
         console.print("[bold cyan]hirocli teardown[/bold cyan]")
 
+        from ..tools.server import UninstallTool
+
         try:
             result = UninstallTool().execute(
                 workspace=workspace,
@@ -329,6 +338,8 @@ def _print_workspace_status_entry(
     if ws.is_default:
         title += " [cyan](default)[/cyan]"
 
+    from rich.table import Table
+
     table = Table(title=title, show_header=False, box=None, padding=(0, 2))
     table.add_column("Key", style="bold")
     table.add_column("Value")
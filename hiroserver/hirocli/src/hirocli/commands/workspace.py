@@ -15,7 +15,6 @@ from typing import Optional
 import typer
 from hiro_commons.process import is_running, read_pid
 from rich.console import Console
-from rich.table import Table
 
 from ..domain.workspace import WorkspaceError
 from ..tools.workspace import (
@@ -42,6 +41,8 @@ def register(workspace_app: typer.Typer, console: Console) -> None:
             )
             return
 
+        from rich.table import Table
+
         table = Table(title="Workspaces", show_header=True)
         table.add_column("", width=2, no_wrap=True)
         table.add_column("Name", style="bold")
@@ -200,6 +201,8 @@ def register(workspace_app: typer.Typer, console: Console) -> None:
         pid = read_pid(workspace_path, "hirocli.pid")
         running = is_running(pid)
 
+        from rich.table import Table
+
         table = Table(
             title=f"Workspace: {result.name}",
             show_header=False,
@@ -13,3 +13,15 @@ ENV_WORKSPACE_PATH: str = "HIRO_WORKSPACE_PATH"
 ENV_ADMIN_UI: str = "HIRO_ADMIN_UI"
 DEVICE_ID_PREFIX: str = "mobile-"
 DEVICE_ID_SUFFIX_LENGTH: int = 12
+# AgentManager micro-batching: max conversations one worker runs concurrently,
+# and how long to wait for more messages once the first has arrived.
+AGENT_BATCH_MAX_SIZE: int = 8
+AGENT_BATCH_WINDOW_SECONDS: float = 0.005
+# AgentManager shard workers; a conversation always maps to the same worker.
+AGENT_WORKER_CONCURRENCY: int = 8
+# Replies remembered per inbound message id so redelivered messages skip the LLM.
+AGENT_REPLY_CACHE_SIZE: int = 1024
+# CommunicationManager queue bounds: a full inbound queue drops new messages
+# (logged); a full outbound queue makes producers wait for the dispatcher.
+INBOUND_QUEUE_MAX_SIZE: int = 4096
+OUTBOUND_QUEUE_MAX_SIZE: int = 1024
@@ -20,7 +20,7 @@ from pydantic import BaseModel, Field
 
 from hiro_commons.timestamps import utc_iso, utc_now
 
-from .db import db_path, ensure_db
+from .db import DbStamp, db_path, db_stamp, ensure_db
 
 logger = logging.getLogger(__name__)
 
@@ -50,29 +50,59 @@ class AgentConfig(BaseModel):
 # I/O — backed by workspace.db agents table
 # ---------------------------------------------------------------------------
 
-def load_agent_config(workspace_path: Path) -> AgentConfig:
-    """Load the default agent config from workspace.db, creating it if absent."""
+# Per-process cache of the default agent row, keyed by db path and stamped
+# with db_stamp(), which changes on any commit from this or another process
+# in both rollback-journal and WAL mode.
+_default_agent_cache: dict[str, tuple[DbStamp, AgentConfig, str]] = {}
+
+
+def _load_default_agent(workspace_path: Path) -> tuple[AgentConfig, str]:
+    """Return (config, system prompt) for the default agent, seeding if absent."""
     ensure_db(workspace_path)
-    with sqlite3.connect(str(db_path(workspace_path))) as conn:
+    path = db_path(workspace_path)
+    key = str(path)
+    # Stamp taken before the read: a concurrent write can only make the
+    # cached entry look older than it is, never newer.
+    stamp = db_stamp(workspace_path)
+    cached = _default_agent_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1], cached[2]
+
+    with sqlite3.connect(key) as conn:
         conn.row_factory = sqlite3.Row
         row = conn.execute(
-            "SELECT * FROM agents WHERE is_default = 1 LIMIT 1"
+            "SELECT provider, model, temperature, max_tokens, system_prompt"
+            " FROM agents WHERE is_default = 1 LIMIT 1"
         ).fetchone()
         if row is None:
             # first boot: seed the default agent row and return defaults
             _insert_default_agent(conn)
-            return AgentConfig()
-        return AgentConfig(
-            provider=row["provider"],
-            model=row["model"],
-            temperature=row["temperature"],
-            max_tokens=row["max_tokens"],
-        )
+            config = AgentConfig()
+            prompt = _DEFAULT_SYSTEM_PROMPT.strip()
+        else:
+            config = AgentConfig(
+                provider=row["provider"],
+                model=row["model"],
+                temperature=row["temperature"],
+                max_tokens=row["max_tokens"],
+            )
+            prompt = (row["system_prompt"] or _DEFAULT_SYSTEM_PROMPT).strip()
+
+    _default_agent_cache[key] = (stamp, config, prompt)
+    return config, prompt
+
+
+def load_agent_config(workspace_path: Path) -> AgentConfig:
+    """Load the default agent config from workspace.db, creating it if absent."""
+    config, _ = _load_default_agent(workspace_path)
+    # Copy so callers can't mutate the cached instance.
+    return config.model_copy()
 
 
 def save_agent_config(workspace_path: Path, config: AgentConfig) -> None:
     """Persist LLM settings for the default agent."""
     ensure_db(workspace_path)
+    _default_agent_cache.pop(str(db_path(workspace_path)), None)
     with sqlite3.connect(str(db_path(workspace_path))) as conn:
         conn.row_factory = sqlite3.Row
         row = conn.execute(
@@ -94,22 +124,14 @@ def save_agent_config(workspace_path: Path, config: AgentConfig) -> None:
 
 def load_system_prompt(workspace_path: Path) -> str:
     """Load the system prompt for the default agent, seeding defaults if absent."""
-    ensure_db(workspace_path)
-    with sqlite3.connect(str(db_path(workspace_path))) as conn:
-        conn.row_factory = sqlite3.Row
-        row = conn.execute(
-            "SELECT system_prompt FROM agents WHERE is_default = 1 LIMIT 1"
-        ).fetchone()
-        if row is None:
-            _insert_default_agent(conn)
-            return _DEFAULT_SYSTEM_PROMPT.strip()
-        prompt = row["system_prompt"] or ""
-        return (prompt if prompt else _DEFAULT_SYSTEM_PROMPT).strip()
+    _, prompt = _load_default_agent(workspace_path)
+    return prompt
 
 
 def save_system_prompt(workspace_path: Path, prompt: str) -> None:
     """Persist a new system prompt for the default agent."""
     ensure_db(workspace_path)
+    _default_agent_cache.pop(str(db_path(workspace_path)), None)
     with sqlite3.connect(str(db_path(workspace_path))) as conn:
         if not conn.execute(
             "SELECT 1 FROM agents WHERE is_default = 1"
@@ -6,7 +6,6 @@ Config is stored in the channel_plugins table of workspace.db.
 
 from __future__ import annotations
 
-import json
 import logging
 import sqlite3
 import sys
@@ -14,14 +13,15 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from hiro_commons.encoding import JSONDecodeError, json_dumps, json_loads
 from hiro_commons.process import find_workspace_root
 
-from .db import db_path, ensure_db
+from .db import DbStamp, db_path, db_stamp, ensure_db
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChannelConfig:
     """Persisted configuration for one channel plugin."""
 
@@ -73,13 +73,14 @@ def load_channel_config(workspace_path: Path, name: str) -> ChannelConfig | None
             return None
         try:
             return _row_to_config(row)
-        except (json.JSONDecodeError, ValueError, TypeError) as exc:
+        except (JSONDecodeError, ValueError, TypeError) as exc:
             logger.warning("Corrupt channel_plugins row (name=%r): %s", name, exc)
             return None
 
 
 def save_channel_config(workspace_path: Path, cfg: ChannelConfig) -> None:
     ensure_db(workspace_path)
+    _configs_cache.pop(str(db_path(workspace_path)), None)
     with sqlite3.connect(str(db_path(workspace_path))) as conn:
         conn.execute(
             """
@@ -94,8 +95,9 @@ def save_channel_config(workspace_path: Path, cfg: ChannelConfig) -> None:
             (
                 cfg.name,
                 int(cfg.enabled),
-                json.dumps(cfg.command),
-                json.dumps(cfg.config),
+                # orjson-backed; decoded so the columns stay TEXT, not BLOB.
+                json_dumps(cfg.command).decode(),
+                json_dumps(cfg.config).decode(),
                 cfg.workspace_dir,
             ),
         )
@@ -103,48 +105,19 @@ def save_channel_config(workspace_path: Path, cfg: ChannelConfig) -> None:
 
 
 def list_channel_configs(workspace_path: Path) -> list[ChannelConfig]:
-    ensure_db(workspace_path)
-    with sqlite3.connect(str(db_path(workspace_path))) as conn:
-        conn.row_factory = sqlite3.Row
-        rows = conn.execute(
-            "SELECT * FROM channel_plugins ORDER BY name"
-        ).fetchall()
-        configs: list[ChannelConfig] = []
-        for row in rows:
-            try:
-                configs.append(_row_to_config(row))
-            except (json.JSONDecodeError, ValueError, TypeError) as exc:
-                logger.warning(
-                    "Skipping corrupt channel_plugins row (name=%r): %s",
-                    row["name"],
-                    exc,
-                )
-        return configs
+    return [_copy_config(cfg) for cfg in _load_all_configs(workspace_path)]
 
 
 def list_enabled_channels(workspace_path: Path) -> list[ChannelConfig]:
-    ensure_db(workspace_path)
-    with sqlite3.connect(str(db_path(workspace_path))) as conn:
-        conn.row_factory = sqlite3.Row
-        rows = conn.execute(
-            "SELECT * FROM channel_plugins WHERE enabled = 1 ORDER BY name"
-        ).fetchall()
-        configs: list[ChannelConfig] = []
-        for row in rows:
-            try:
-                configs.append(_row_to_config(row))
-            except (json.JSONDecodeError, ValueError, TypeError) as exc:
-                logger.warning(
-                    "Skipping corrupt channel_plugins row (name=%r): %s",
-                    row["name"],
-                    exc,
-                )
-        return configs
+    return [
+        _copy_config(cfg) for cfg in _load_all_configs(workspace_path) if cfg.enabled
+    ]
 
 
 def delete_channel_config(workspace_path: Path, name: str) -> bool:
     """Delete a channel_plugins row by name. Returns True if a row was removed."""
     ensure_db(workspace_path)
+    _configs_cache.pop(str(db_path(workspace_path)), None)
     with sqlite3.connect(str(db_path(workspace_path))) as conn:
         cursor = conn.execute(
             "DELETE FROM channel_plugins WHERE name = ?", (name,)
@@ -157,11 +130,59 @@ def delete_channel_config(workspace_path: Path, name: str) -> bool:
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+# Per-process cache of the parsed channel_plugins table, keyed by db path.
+# Stamped with db_stamp() like the agent row cache in agent_config: any
+# commit, from any process and in either journal mode, invalidates it.
+_configs_cache: dict[str, tuple[DbStamp, list[ChannelConfig]]] = {}
+
+
+def _load_all_configs(workspace_path: Path) -> list[ChannelConfig]:
+    """Return every parseable channel_plugins row, ordered by name (cached)."""
+    ensure_db(workspace_path)
+    path = db_path(workspace_path)
+    key = str(path)
+    # Stamp taken before the read: a concurrent write can only make the
+    # cached entry look older than it is, never newer.
+    stamp = db_stamp(workspace_path)
+    cached = _configs_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    with sqlite3.connect(key) as conn:
+        conn.row_factory = sqlite3.Row
+        rows = conn.execute(
+            "SELECT * FROM channel_plugins ORDER BY name"
+        ).fetchall()
+    configs: list[ChannelConfig] = []
+    for row in rows:
+        try:
+            configs.append(_row_to_config(row))
+        except (JSONDecodeError, ValueError, TypeError) as exc:
+            logger.warning(
+                "Skipping corrupt channel_plugins row (name=%r): %s",
+                row["name"],
+                exc,
+            )
+    _configs_cache[key] = (stamp, configs)
+    return configs
+
+
+def _copy_config(cfg: ChannelConfig) -> ChannelConfig:
+    # Callers edit and save configs in place; never hand out the cached ones.
+    return ChannelConfig(
+        name=cfg.name,
+        enabled=cfg.enabled,
+        command=list(cfg.command),
+        config=dict(cfg.config),
+        workspace_dir=cfg.workspace_dir,
+    )
+
+
 def _row_to_config(row: sqlite3.Row) -> ChannelConfig:
     return ChannelConfig(
         name=row["name"],
         enabled=bool(row["enabled"]),
-        command=json.loads(row["command"] or "[]"),
-        config=json.loads(row["config"] or "{}"),
+        command=json_loads(row["command"] or "[]"),
+        config=json_loads(row["config"] or "{}"),
         workspace_dir=row["workspace_dir"] or "",
     )
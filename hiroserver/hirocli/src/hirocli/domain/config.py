@@ -26,6 +26,7 @@ from typing import Optional
 
 from pydantic import BaseModel, Field
 
+from hiro_commons.atomic import atomic_write_bytes
 from hiro_commons.constants.domain import (
     DEFAULT_ATTESTATION_EXPIRY_DAYS,
     DEFAULT_PAIRING_CODE_LENGTH,
@@ -93,6 +94,26 @@ def resolve_log_dir(workspace_path: Path, config: Config) -> Path:
     return workspace_log_dir(workspace_path)
 
 
+# ---------------------------------------------------------------------------
+# Parsed-file caches
+# ---------------------------------------------------------------------------
+
+# Per-process caches of the parsed config.json / state.json, keyed by path
+# and stamped with (st_mtime_ns, st_size, st_ino). A write from any process
+# (or an editor's replace-on-save) changes the stamp and forces a re-parse.
+_config_cache: dict[Path, tuple[tuple[int, int, int], Config]] = {}
+_state_cache: dict[Path, tuple[tuple[int, int, int], State]] = {}
+
+
+def _file_stamp(path: Path) -> tuple[int, int, int] | None:
+    """Return the cache stamp for *path*, or None if it does not exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
 # ---------------------------------------------------------------------------
 # Config I/O
 # ---------------------------------------------------------------------------
@@ -100,16 +121,27 @@ def resolve_log_dir(workspace_path: Path, config: Config) -> Path:
 def load_config(workspace_path: Path) -> Config:
     workspace_path.mkdir(parents=True, exist_ok=True)
     cfg_file = workspace_config_file(workspace_path)
-    if cfg_file.exists():
-        return Config.model_validate_json(cfg_file.read_text(encoding="utf-8"))
-    return Config()
+    # Stamp taken before the read: a concurrent write can only make the
+    # cached entry look older than it is, never newer.
+    stamp = _file_stamp(cfg_file)
+    if stamp is None:
+        return Config()
+    cached = _config_cache.get(cfg_file)
+    if cached is None or cached[0] != stamp:
+        # Raw bytes go straight to pydantic-core's JSON parser (no str decode).
+        cached = (stamp, Config.model_validate_json(cfg_file.read_bytes()))
+        _config_cache[cfg_file] = cached
+    # Deep copy: callers edit (e.g. log_levels) and save configs in place.
+    return cached[1].model_copy(deep=True)
 
 
 def save_config(workspace_path: Path, config: Config) -> None:
     workspace_path.mkdir(parents=True, exist_ok=True)
-    workspace_config_file(workspace_path).write_text(
-        config.model_dump_json(indent=2), encoding="utf-8"
-    )
+    cfg_file = workspace_config_file(workspace_path)
+    _config_cache.pop(cfg_file, None)
+    # Atomic replace: `status` and the server read config.json concurrently
+    # with `setup`, and must never see a truncated file.
+    atomic_write_bytes(cfg_file, config.model_dump_json(indent=2).encode("utf-8"))
 
 
 # ---------------------------------------------------------------------------
@@ -119,19 +151,25 @@ def save_config(workspace_path: Path, config: Config) -> None:
 def load_state(workspace_path: Path) -> State:
     workspace_path.mkdir(parents=True, exist_ok=True)
     state_file = workspace_state_file(workspace_path)
-    if state_file.exists():
+    stamp = _file_stamp(state_file)
+    if stamp is None:
+        return State()
+    cached = _state_cache.get(state_file)
+    if cached is None or cached[0] != stamp:
         try:
-            return State.model_validate_json(state_file.read_text(encoding="utf-8"))
+            cached = (stamp, State.model_validate_json(state_file.read_bytes()))
         except Exception:
-            pass
-    return State()
+            return State()
+        _state_cache[state_file] = cached
+    return cached[1].model_copy()
 
 
 def save_state(workspace_path: Path, state: State) -> None:
     workspace_path.mkdir(parents=True, exist_ok=True)
-    workspace_state_file(workspace_path).write_text(
-        state.model_dump_json(indent=2), encoding="utf-8"
-    )
+    state_file = workspace_state_file(workspace_path)
+    _state_cache.pop(state_file, None)
+    # Rewritten on every gateway (dis)connect while `status` may be reading it.
+    atomic_write_bytes(state_file, state.model_dump_json(indent=2).encode("utf-8"))
 
 
 def mark_connected(workspace_path: Path, gateway_url: str) -> None:
@@ -144,5 +182,9 @@ def mark_connected(workspace_path: Path, gateway_url: str) -> None:
 
 def mark_disconnected(workspace_path: Path) -> None:
     state = load_state(workspace_path)
+    # A reconnect storm reports every failed attempt; only the first
+    # transition changes anything on disk.
+    if not state.ws_connected:
+        return
     state.ws_connected = False
     save_state(workspace_path, state)
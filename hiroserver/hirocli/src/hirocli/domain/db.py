@@ -29,14 +29,20 @@ columns always set by application code at insert time.
 
 from __future__ import annotations
 
+import itertools
 import sqlite3
+import threading
 from contextlib import asynccontextmanager
 from pathlib import Path
-
-import aiosqlite
+from typing import TYPE_CHECKING
 
 from hiro_commons.constants.storage import CONVERSATIONS_DIR, WORKSPACE_DB_FILENAME
 
+if TYPE_CHECKING:
+    # Imported lazily in init_db: every CLI command reaches ensure_db, but
+    # only the server process opens async connections.
+    import aiosqlite
+
 # Per-process cache: paths for which ensure_db has already run successfully.
 # Keyed by the resolved string workspace path.
 _initialized: set[str] = set()
@@ -145,6 +151,53 @@ def db_path(workspace_path: Path) -> Path:
     return workspace_path / WORKSPACE_DB_FILENAME
 
 
+# ---------------------------------------------------------------------------
+# Change stamp — for per-process read caches over workspace.db
+# ---------------------------------------------------------------------------
+
+# (connection generation, PRAGMA data_version) — see db_stamp.
+DbStamp = tuple[int, int]
+
+# One idle read-only-by-use connection per db path, used only to ask for
+# data_version.  Shared across threads (the admin UI calls domain functions
+# from worker threads), hence check_same_thread=False plus the lock.
+_stamp_conns: dict[str, tuple[int, sqlite3.Connection]] = {}
+_stamp_lock = threading.Lock()
+_stamp_generation = itertools.count()
+
+
+def db_stamp(workspace_path: Path) -> DbStamp:
+    """Return a value that changes whenever any connection commits to workspace.db.
+
+    The file's mtime/size is not enough: the server's LangGraph checkpointer
+    switches the database to WAL mode (a persistent setting), after which
+    commits land in workspace.db-wal and the main file is untouched until a
+    checkpoint.  PRAGMA data_version reports commits made by any other
+    connection, in this or another process, in both journal modes; it is
+    only comparable on one connection, so a long-lived connection per path
+    is kept and its generation is part of the stamp.
+    """
+    key = str(db_path(workspace_path))
+    with _stamp_lock:
+        entry = _stamp_conns.get(key)
+        if entry is None:
+            conn = sqlite3.connect(key, check_same_thread=False)
+            entry = _stamp_conns[key] = (next(_stamp_generation), conn)
+        generation, conn = entry
+        # fetchall steps the statement to completion so no read transaction
+        # is left open (an open one would block WAL checkpoints).
+        ((version,),) = conn.execute("PRAGMA data_version").fetchall()
+    return generation, version
+
+
+def release_db_stamp(workspace_path: Path) -> None:
+    """Close the stamp connection for *workspace_path* (before deleting it)."""
+    with _stamp_lock:
+        entry = _stamp_conns.pop(str(db_path(workspace_path)), None)
+    if entry is not None:
+        entry[1].close()
+
+
 # ---------------------------------------------------------------------------
 # Synchronous interface — used by domain functions and CLI commands
 # ---------------------------------------------------------------------------
@@ -201,6 +254,8 @@ async def init_db(workspace_path: Path) -> aiosqlite.Connection:
     The caller is responsible for closing the connection.
     Prefer get_db() as an async context manager for automatic cleanup.
     """
+    import aiosqlite
+
     ensure_db(workspace_path)
     return await aiosqlite.connect(str(db_path(workspace_path)))
 
@@ -99,7 +99,7 @@ def load_pairing_session(workspace_path: Path) -> PairingSession | None:
     if not path.exists():
         return None
     try:
-        session = PairingSession.model_validate_json(path.read_text(encoding="utf-8"))
+        session = PairingSession.model_validate_json(path.read_bytes())
     except Exception:
         return None
     if not session.is_valid():
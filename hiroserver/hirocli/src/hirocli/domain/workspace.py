@@ -38,6 +38,7 @@ from hiro_commons.constants.network import PORT_OFFSET_ADMIN, PORT_OFFSET_PLUGIN
 from hiro_commons.constants.storage import REGISTRY_FILENAME
 
 from ..constants import APP_NAME, ENV_WORKSPACE
+from .db import release_db_stamp
 
 
 class WorkspaceError(Exception):
@@ -105,7 +106,7 @@ def load_registry() -> WorkspaceRegistry:
     rp = registry_path()
     if rp.exists():
         try:
-            return WorkspaceRegistry.model_validate_json(rp.read_text(encoding="utf-8"))
+            return WorkspaceRegistry.model_validate_json(rp.read_bytes())
         except Exception:
             pass
     return WorkspaceRegistry()
@@ -236,6 +237,9 @@ def remove_workspace(ws_id: str, *, purge: bool = False) -> None:
     if purge:
         workspace_path = Path(entry.path)
         if workspace_path.exists():
+            # The cached stamp connection holds workspace.db open, which
+            # would stop rmtree from deleting it on Windows.
+            release_db_stamp(workspace_path)
             shutil.rmtree(workspace_path, ignore_errors=True)
 
 
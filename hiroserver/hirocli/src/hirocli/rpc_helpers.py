@@ -6,6 +6,7 @@ Kept as a standalone module so hirocli does not need to import hiro-channel-sdk.
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from typing import Any
 from uuid import uuid4
 
@@ -19,6 +20,22 @@ def build_notification(method: str, params: dict[str, Any] | None = None) -> str
     )
 
 
+@lru_cache(maxsize=32)
+def _notification_prefix(method: str) -> bytes:
+    """``{"jsonrpc":"2.0","method":"<method>","params":`` for *method*."""
+    head = {"jsonrpc": JSONRPC_VERSION, "method": method}
+    return json.dumps(head, separators=(",", ":"))[:-1].encode() + b',"params":'
+
+
+def build_notification_json(method: str, params_json: bytes) -> bytes:
+    """Like build_notification, with *params* already serialised to JSON bytes.
+
+    The bytes are spliced in as-is, so a model serialised by pydantic-core
+    is never decoded back into a dict just to be encoded again.
+    """
+    return b"".join((_notification_prefix(method), params_json, b"}"))
+
+
 def build_request(
     method: str,
     params: dict[str, Any] | None = None,
@@ -1,28 +1,39 @@
 """AgentManager — LLM agent worker for hirocli.
 
 Responsibilities:
-  - Reads inbound text messages from CommunicationManager.inbound_queue.
-  - Passes each message to a LangChain v1 create_agent instance.
+  - Reads inbound text messages from CommunicationManager's "text" queue.
+  - Shards messages by conversation across concurrent workers; each worker
+    micro-batches its shard (at most one turn per conversation per batch) and
+    runs the batch's turns concurrently on a LangChain v1 create_agent
+    instance, sending each reply as soon as its own turn finishes.
   - Maintains per-conversation persistent memory keyed by conversation_channels.id
     (a UUID) using LangGraph's AsyncSqliteSaver checkpointer backed by workspace.db.
   - Constructs a reply UnifiedMessage and places it on the outbound queue.
   - On LLM errors, enqueues a human-readable fallback reply instead.
 
-Non-text messages (image, audio, video, etc.) are silently ignored by this
-worker; they remain unconsumed on the inbound queue only if no other consumer
-reads them first.  Currently inbound_queue has only one consumer (this worker),
-so non-text messages are drained and dropped.
+Non-text messages (image, audio, video, etc.) are never delivered to this
+worker; CommunicationManager drops content types nobody has subscribed to.
 """
 
 from __future__ import annotations
 
+import asyncio
 import uuid
-from datetime import UTC, datetime
+from collections import OrderedDict, deque
+from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from hiro_channel_sdk.models import UnifiedMessage
 from hiro_commons.log import Logger
+from hiro_commons.timestamps import utc_now
+
+from ..constants import (
+    AGENT_BATCH_MAX_SIZE,
+    AGENT_BATCH_WINDOW_SECONDS,
+    AGENT_REPLY_CACHE_SIZE,
+    AGENT_WORKER_CONCURRENCY,
+)
 
 if TYPE_CHECKING:
     from .communication_manager import CommunicationManager
@@ -34,9 +45,10 @@ _FALLBACK_ERROR_BODY = (
 )
 
 
-def _make_reply(inbound: UnifiedMessage, body: str) -> UnifiedMessage:
+def _make_reply(inbound: UnifiedMessage, body: str, timestamp: datetime) -> UnifiedMessage:
     return UnifiedMessage(
-        id=str(uuid.uuid4()),
+        # Same id format as UnifiedMessage's own default (no dashed str()).
+        id=uuid.uuid4().hex,
         channel=inbound.channel,
         direction="outbound",
         sender_id="server",
@@ -44,10 +56,14 @@ def _make_reply(inbound: UnifiedMessage, body: str) -> UnifiedMessage:
         content_type="text",
         body=body,
         metadata={},
-        timestamp=datetime.now(UTC),
+        timestamp=timestamp,
     )
 
 
+def _reply_key(msg: UnifiedMessage) -> tuple[str, str, str]:
+    return (msg.channel, msg.sender_id, msg.id)
+
+
 class AgentManager:
     """Consumes inbound text messages and produces agent replies.
 
@@ -57,9 +73,24 @@ class AgentManager:
         await asyncio.gather(..., agent_mgr.run())
     """
 
-    def __init__(self, comm_manager: CommunicationManager, workspace_path: Path) -> None:
+    def __init__(
+        self,
+        comm_manager: CommunicationManager,
+        workspace_path: Path,
+        concurrency: int = AGENT_WORKER_CONCURRENCY,
+    ) -> None:
         self._comm = comm_manager
         self._workspace_path = workspace_path
+        # Only text is subscribed: CommunicationManager routes by content_type,
+        # so media messages never reach (or are buffered for) this worker.
+        self._inbound = comm_manager.subscribe("text")
+        # Number of shard workers; one slow LLM call only holds up its shard.
+        self._concurrency = max(1, concurrency)
+        # (channel, sender_id, msg.id) -> reply body, LRU-bounded by
+        # AGENT_REPLY_CACHE_SIZE. Message ids are client-supplied, so the id
+        # alone would hand one sender's reply to another reusing that id.
+        self._replies: OrderedDict[tuple[str, str, str], str] = OrderedDict()
+        self._configs: dict[str, dict] = {}  # thread_id -> runnable config
         self._agent = None  # built inside run() once the async checkpointer is ready
 
     def _build_agent(self, checkpointer):
@@ -107,9 +138,95 @@ class AgentManager:
         channel = get_or_create_channel(self._workspace_path, channel_name)
         return channel.id
 
-    async def _process(self, msg: UnifiedMessage) -> None:
+    def _config_for(self, thread_id: str) -> dict:
+        """Return the (shared) runnable config for *thread_id*."""
+        # One config dict per conversation instead of two fresh dicts per
+        # message; LangChain copies configs before merging, so sharing is safe.
+        config = self._configs.get(thread_id)
+        if config is None:
+            config = self._configs[thread_id] = {"configurable": {"thread_id": thread_id}}
+        return config
+
+    def _take(
+        self,
+        msg: UnifiedMessage,
+        batch: list[UnifiedMessage],
+        seen: set[tuple[str, str]],
+    ) -> bool:
+        """Add *msg* to *batch*; False if its conversation is already in."""
+        # channel + sender identifies the thread (see _resolve_thread_id).
+        # Two turns of one conversation must not run concurrently against
+        # the same checkpoint, so the later one waits for the next batch.
+        key = (msg.channel, msg.sender_id)
+        if key in seen:
+            return False
+        seen.add(key)
+        batch.append(msg)
+        return True
+
+    async def _next_batch(
+        self,
+        queue: asyncio.Queue[UnifiedMessage],
+        carry: deque[UnifiedMessage],
+    ) -> list[UnifiedMessage]:
+        """Collect up to AGENT_BATCH_MAX_SIZE messages from distinct conversations.
+
+        Blocks for the first message, then keeps draining *queue* until it is
+        empty for AGENT_BATCH_WINDOW_SECONDS, the batch is full, or a message
+        belongs to a conversation already in the batch.  That message is left
+        in *carry* to open the next batch, so *carry* never holds more than
+        one message and per-conversation order is preserved.
+        """
+        batch: list[UnifiedMessage] = []
+        seen: set[tuple[str, str]] = set()
+
+        if carry:
+            # Starts an empty batch, so it is always taken.
+            self._take(carry.popleft(), batch, seen)
+        else:
+            self._take(await queue.get(), batch, seen)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + AGENT_BATCH_WINDOW_SECONDS
+        while len(batch) < AGENT_BATCH_MAX_SIZE:
+            try:
+                msg = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    async with asyncio.timeout(remaining):
+                        msg = await queue.get()
+                except TimeoutError:
+                    break
+            if not self._take(msg, batch, seen):
+                carry.append(msg)
+                break
+        return batch
+
+    async def _process_batch(self, batch: list[UnifiedMessage]) -> None:
+        # Redelivered messages (channel retries) get the reply already produced
+        # for them: a second agent turn would cost a full LLM call and append
+        # the same user message to the conversation history twice.
+        fresh: list[UnifiedMessage] = []
+        for msg in batch:
+            key = _reply_key(msg)
+            cached = self._replies.get(key)
+            if cached is None:
+                fresh.append(msg)
+                continue
+            self._replies.move_to_end(key)
+            reply = _make_reply(msg, cached, utc_now())
+            await self._comm.enqueue_outbound(reply)
+            log.info("Duplicate message; cached reply enqueued", msg_id=msg.id, reply_msg_id=reply.id)
+        # The turns overlap their LLM round-trips; each reply goes out as soon
+        # as its own turn finishes rather than waiting for the slowest one.
+        await asyncio.gather(*(self._answer(msg) for msg in fresh))
+
+    async def _answer(self, msg: UnifiedMessage) -> None:
+        """Run one agent turn for *msg* and enqueue the reply (or the fallback)."""
         thread_id = self._resolve_thread_id(msg)
-        config = {"configurable": {"thread_id": thread_id}}
         log.info(
             "Processing message",
             msg_id=msg.id,
@@ -120,19 +237,25 @@ class AgentManager:
         try:
             result = await self._agent.ainvoke(
                 {"messages": [{"role": "user", "content": msg.body}]},
-                config=config,
+                config=self._config_for(thread_id),
             )
-            reply_body: str = result["messages"][-1].content
         except Exception as exc:
             log.error(
                 "Agent invocation error",
                 thread=thread_id,
                 error=str(exc),
-                exc_info=True,
+                exc_info=exc,
             )
             reply_body = _FALLBACK_ERROR_BODY
+        else:
+            reply_body = result["messages"][-1].content
+            # Only successful replies are remembered; a retry after an
+            # error should reach the agent again.
+            self._replies[_reply_key(msg)] = reply_body
+            if len(self._replies) > AGENT_REPLY_CACHE_SIZE:
+                self._replies.popitem(last=False)
 
-        reply = _make_reply(msg, reply_body)
+        reply = _make_reply(msg, reply_body, utc_now())
         await self._comm.enqueue_outbound(reply)
         log.info(
             "Agent reply enqueued",
@@ -142,8 +265,34 @@ class AgentManager:
             content_length=len(reply_body),
         )
 
+    async def _worker_loop(self, queue: asyncio.Queue[UnifiedMessage]) -> None:
+        """Batch and process one shard's messages in order."""
+        # At most one message already taken off the queue whose conversation
+        # had a turn in the previous batch (see _next_batch).
+        carry: deque[UnifiedMessage] = deque()
+        while True:
+            batch = await self._next_batch(queue, carry)
+            try:
+                await self._process_batch(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _dispatch_inbound(self, shards: list[asyncio.Queue[UnifiedMessage]]) -> None:
+        """Route inbound text messages to workers, one shard per conversation."""
+        inbound = self._inbound
+        while True:
+            msg: UnifiedMessage = await inbound.get()
+            try:
+                # Same conversation -> same worker, so its turns stay ordered
+                # while other conversations proceed on the other workers.
+                shard = shards[hash((msg.channel, msg.sender_id)) % len(shards)]
+                shard.put_nowait(msg)
+            finally:
+                inbound.task_done()
+
     async def run(self) -> None:
-        """Build the agent with a persistent SQLite checkpointer then drain inbound_queue."""
+        """Build the agent with a persistent SQLite checkpointer then drain the text queue."""
         from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 
         from ..domain.db import db_path
@@ -154,18 +303,14 @@ class AgentManager:
         # They coexist with the application tables without conflict.
         async with AsyncSqliteSaver.from_conn_string(db) as checkpointer:
             self._agent = self._build_agent(checkpointer)
-            log.info("AgentManager started")
-            while True:
-                msg: UnifiedMessage = await self._comm.inbound_queue.get()
-                try:
-                    if msg.content_type != "text":
-                        log.info(
-                            "Ignoring non-text message",
-                            msg_id=msg.id,
-                            content_type=msg.content_type,
-                            sender=msg.sender_id,
-                        )
-                        continue
-                    await self._process(msg)
-                finally:
-                    self._comm.inbound_queue.task_done()
+            log.info("AgentManager started", workers=self._concurrency)
+            # Unbounded: the dispatcher must never wait on one shard, or a slow
+            # conversation would stall every other shard behind it.
+            shards: list[asyncio.Queue[UnifiedMessage]] = [
+                asyncio.Queue() for _ in range(self._concurrency)
+            ]
+            # TaskGroup: cancelling run() (server shutdown) cancels every worker.
+            async with asyncio.TaskGroup() as tg:
+                for shard in shards:
+                    tg.create_task(self._worker_loop(shard))
+                await self._dispatch_inbound(shards)
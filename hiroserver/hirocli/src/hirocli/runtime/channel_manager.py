@@ -110,16 +110,17 @@ class ChannelManager:
             log.info("No enabled channel plugins configured")
             return
 
-        hiro_ws = f"ws://{self._host}:{self._port}"
+        # The launch arguments are the same for every plugin; build them once
+        # rather than re-resolving the log dir per spawn.
+        launch_args = [
+            "--hiro-ws", f"ws://{self._host}:{self._port}",
+            "--log-dir", str(resolve_log_dir(self._workspace_path, self._config)),
+        ]
         for ch in channels:
-            await self._spawn_one(ch, hiro_ws)
+            await self._spawn_one(ch, launch_args)
 
-    async def _spawn_one(self, ch: ChannelConfig, hiro_ws: str) -> None:
-        log_dir = resolve_log_dir(self._workspace_path, self._config)
-        cmd = ch.effective_command() + [
-            "--hiro-ws", hiro_ws,
-            "--log-dir", str(log_dir),
-        ]
+    async def _spawn_one(self, ch: ChannelConfig, launch_args: list[str]) -> None:
+        cmd = ch.effective_command() + launch_args
         self._kill_previous_channel(ch.name)
         log.info("Spawning channel plugin", channel=ch.name, cmd=cmd)
         try:
@@ -324,14 +325,13 @@ class ChannelManager:
     # Outbound API (hirocli → plugin)
     # ------------------------------------------------------------------
 
-    async def send_to_channel(
-        self, channel_name: str, message: dict[str, Any]
-    ) -> None:
+    async def send_to_channel(self, channel_name: str, message_json: bytes) -> None:
+        """Send an already JSON-encoded UnifiedMessage to one channel plugin."""
         ch = self._channels.get(channel_name)
         if ch is None:
             log.warning("Cannot send to channel — not connected", channel=channel_name)
             return
-        await ch.ws.send(rpc.build_notification(METHOD_SEND, message))
+        await ch.ws.send(rpc.build_notification_json(METHOD_SEND, message_json))
 
     async def broadcast(self, message: dict[str, Any]) -> None:
         for ch in list(self._channels.values()):
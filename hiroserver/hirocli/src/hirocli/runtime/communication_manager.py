@@ -2,7 +2,8 @@
 
 Responsibilities:
   - Receives inbound UnifiedMessages from all channel plugins (via ChannelManager's
-    on_message callback) and places them on the inbound queue.
+    on_message callback) and places them on the inbound queue subscribed for
+    their content_type.
   - Monitors the outbound queue and routes each message to the correct channel
     plugin via ChannelManager.send_to_channel.
   - Performs permission checks (placeholder — to be implemented).
@@ -14,8 +15,11 @@ import asyncio
 from typing import TYPE_CHECKING, Any
 
 from hiro_channel_sdk.models import UnifiedMessage
+from pydantic_core import to_json
 from hiro_commons.log import Logger
 
+from ..constants import INBOUND_QUEUE_MAX_SIZE, OUTBOUND_QUEUE_MAX_SIZE
+
 if TYPE_CHECKING:
     from .channel_manager import ChannelManager
 
@@ -48,8 +52,12 @@ class CommunicationManager:
 
     def __init__(self) -> None:
         self._channel_manager: ChannelManager | None = None
-        self.inbound_queue: asyncio.Queue[UnifiedMessage] = asyncio.Queue()
-        self.outbound_queue: asyncio.Queue[UnifiedMessage] = asyncio.Queue()
+        # content_type -> queue of its consumer. Types without a subscriber are
+        # dropped in receive() instead of piling up where nobody reads them.
+        self._inbound_queues: dict[str, asyncio.Queue[UnifiedMessage]] = {}
+        self.outbound_queue: asyncio.Queue[UnifiedMessage] = asyncio.Queue(
+            maxsize=OUTBOUND_QUEUE_MAX_SIZE
+        )
 
     def set_channel_manager(self, channel_manager: ChannelManager) -> None:
         """Bind the ChannelManager after both objects have been constructed."""
@@ -59,11 +67,20 @@ class CommunicationManager:
     # Inbound path  (channel plugin → hirocli core)
     # ------------------------------------------------------------------
 
+    def subscribe(self, content_type: str) -> asyncio.Queue[UnifiedMessage]:
+        """Return the inbound queue for *content_type*, creating it on first use."""
+        queue = self._inbound_queues.get(content_type)
+        if queue is None:
+            queue = self._inbound_queues[content_type] = asyncio.Queue(
+                maxsize=INBOUND_QUEUE_MAX_SIZE
+            )
+        return queue
+
     async def receive(self, data: dict[str, Any]) -> None:
         """Accept a raw params dict from ChannelManager's channel.receive handler.
 
         Validates it as a UnifiedMessage, runs the permission check, then
-        places it on the inbound queue for downstream consumers.
+        places it on the queue subscribed for its content_type.
         """
         try:
             msg = UnifiedMessage.model_validate(data)
@@ -82,7 +99,30 @@ class CommunicationManager:
             )
             return
 
-        self.inbound_queue.put_nowait(msg)
+        queue = self._inbound_queues.get(msg.content_type)
+        if queue is None:
+            log.info(
+                "Inbound message dropped — no consumer for content type",
+                msg_id=msg.id,
+                channel=msg.channel,
+                sender=msg.sender_id,
+                content_type=msg.content_type,
+            )
+            return
+
+        try:
+            queue.put_nowait(msg)
+        except asyncio.QueueFull:
+            # Consumer is behind by INBOUND_QUEUE_MAX_SIZE messages: shed load
+            # here rather than buffering without limit.
+            log.warning(
+                "Inbound message dropped — queue full",
+                msg_id=msg.id,
+                channel=msg.channel,
+                sender=msg.sender_id,
+                content_type=msg.content_type,
+            )
+            return
         log.info(
             "Inbound message queued",
             msg_id=msg.id,
@@ -107,37 +147,76 @@ class CommunicationManager:
         )
 
     async def _outbound_worker(self) -> None:
-        """Continuously drain the outbound queue and dispatch to channel plugins."""
+        """Continuously drain the outbound queue and dispatch to channel plugins.
+
+        Everything already queued is taken as one batch. Each channel's
+        messages are sent in order, while different channels are sent to
+        concurrently so one slow plugin socket doesn't hold up the others.
+        """
+        queue = self.outbound_queue
         while True:
-            msg = await self.outbound_queue.get()
-            try:
+            batch = [await queue.get()]
+            while True:
                 try:
-                    _check_permissions(msg)
-                except PermissionError as exc:
-                    log.warning(
-                        "Outbound message blocked by permission check",
-                        channel=msg.channel,
-                        recipient=msg.recipient_id,
-                        error=str(exc),
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                by_channel: dict[str, list[UnifiedMessage]] = {}
+                for msg in batch:
+                    by_channel.setdefault(msg.channel, []).append(msg)
+                if len(by_channel) == 1:
+                    await self._dispatch_in_order(batch)
+                else:
+                    await asyncio.gather(
+                        *(self._dispatch_in_order(msgs) for msgs in by_channel.values())
                     )
-                    continue
-
-                if self._channel_manager is None:
-                    log.warning("Outbound message dropped — no ChannelManager set")
-                    continue
-
-                log.info(
-                    "Dispatching outbound message",
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _dispatch_in_order(self, msgs: list[UnifiedMessage]) -> None:
+        for msg in msgs:
+            # A failed send loses that one message only. Letting it escape
+            # would end the worker, and once the bounded queue filled up every
+            # enqueue_outbound() would block forever.
+            try:
+                await self._dispatch(msg)
+            except Exception as exc:
+                log.error(
+                    "Outbound message dropped — dispatch failed",
                     msg_id=msg.id,
                     channel=msg.channel,
-                    recipient=msg.recipient_id,
-                    content_type=msg.content_type,
-                )
-                await self._channel_manager.send_to_channel(
-                    msg.channel, msg.model_dump(mode="json")
+                    error=str(exc),
+                    exc_info=exc,
                 )
-            finally:
-                self.outbound_queue.task_done()
+
+    async def _dispatch(self, msg: UnifiedMessage) -> None:
+        try:
+            _check_permissions(msg)
+        except PermissionError as exc:
+            log.warning(
+                "Outbound message blocked by permission check",
+                channel=msg.channel,
+                recipient=msg.recipient_id,
+                error=str(exc),
+            )
+            return
+
+        if self._channel_manager is None:
+            log.warning("Outbound message dropped — no ChannelManager set")
+            return
+
+        log.info(
+            "Dispatching outbound message",
+            msg_id=msg.id,
+            channel=msg.channel,
+            recipient=msg.recipient_id,
+            content_type=msg.content_type,
+        )
+        # Serialised once, straight to JSON bytes by pydantic-core: no
+        # intermediate dict for the RPC layer to walk and re-encode.
+        await self._channel_manager.send_to_channel(msg.channel, to_json(msg))
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -13,7 +13,7 @@ Workspace path resolution:
 from __future__ import annotations
 
 import asyncio
-import json
+import codecs
 import os
 import signal
 import sys
@@ -21,37 +21,104 @@ import uuid
 from datetime import UTC, datetime
 from pathlib import Path
 
+from hiro_commons.eventloop import run as run_event_loop
 from hiro_commons.log import Logger
 from hiro_commons.process import write_pid
+from watchfiles import Change, awatch
 
 from hirocli.constants import DEVICE_ID_PREFIX, DEVICE_ID_SUFFIX_LENGTH, ENV_ADMIN_UI, ENV_WORKSPACE_PATH, PID_FILENAME
 
 log = Logger.get("SERVER")
 
 
+def _is_plugin_log(_change: Change, path: str) -> bool:
+    name = os.path.basename(path)
+    return name.startswith("plugin-") and name.endswith(".log")
+
+
+class _TailedLog:
+    """Open handle on one plugin log plus its UTF-8 decoder state."""
+
+    __slots__ = ("fh", "decoder")
+
+    def __init__(self, path: str, pos: int) -> None:
+        self.fh = open(path, "rb")
+        self.fh.seek(pos)
+        # Incremental so a multi-byte character split across two reads is
+        # decoded whole rather than replaced.
+        self.decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    def read_new(self) -> str:
+        return self.decoder.decode(self.fh.read())
+
+    def is_current(self, path: str) -> bool:
+        """False once *path* was rotated/recreated or truncated under us."""
+        st = os.fstat(self.fh.fileno())
+        try:
+            on_disk = os.stat(path)
+        except OSError:
+            return False
+        return os.path.samestat(st, on_disk) and on_disk.st_size >= self.fh.tell()
+
+    def close(self) -> None:
+        self.fh.close()
+
+
 async def _tail_plugin_logs(log_dir: Path, stop_event: asyncio.Event) -> None:
-    """Forward new lines from plugin-*.log files to stdout in foreground mode."""
-    positions: dict[str, int] = {}
-    while not stop_event.is_set():
-        await asyncio.sleep(0.5)
-        for log_file in sorted(log_dir.glob("plugin-*.log")):
-            key = str(log_file)
-            if key not in positions:
+    """Forward new lines from plugin-*.log files to stdout in foreground mode.
+
+    Driven by filesystem notifications (inotify / ReadDirectoryChangesW /
+    FSEvents via watchfiles) rather than polling, so idle logs cost nothing
+    and new lines show up without a fixed delay.
+    """
+    # Handles stay open between events so each change costs one read. On
+    # Windows an open handle would block the plugin's RotatingFileHandler
+    # rename, so there the file is reopened at the saved offset per event.
+    keep_open = sys.platform != "win32"
+    tails: dict[str, _TailedLog] = {}
+    offsets: dict[str, int] = {}
+
+    # Existing files start at their end; files created later are read whole.
+    for log_file in log_dir.glob("plugin-*.log"):
+        try:
+            offsets[str(log_file)] = log_file.stat().st_size
+        except OSError:
+            offsets[str(log_file)] = 0
+
+    try:
+        async for changes in awatch(log_dir, watch_filter=_is_plugin_log, stop_event=stop_event):
+            for change, key in sorted(changes, key=lambda c: c[1]):
+                tail = tails.get(key)
+                if tail is not None and (change == Change.deleted or not tail.is_current(key)):
+                    tail.close()
+                    del tails[key]
+                    tail = None
+                    offsets[key] = 0
+                if change == Change.deleted:
+                    offsets.pop(key, None)
+                    continue
                 try:
-                    positions[key] = log_file.stat().st_size
+                    if tail is None:
+                        tail = _TailedLog(key, offsets.get(key, 0))
+                        if not tail.is_current(key):
+                            tail.close()
+                            tail = _TailedLog(key, 0)
+                    chunk = tail.read_new()
+                    if keep_open:
+                        tails[key] = tail
+                    else:
+                        offsets[key] = tail.fh.tell()
+                        tail.close()
                 except OSError:
-                    positions[key] = 0
-                continue
-            try:
-                with log_file.open(encoding="utf-8", errors="replace") as fh:
-                    fh.seek(positions[key])
-                    chunk = fh.read()
-                    positions[key] = fh.tell()
+                    if tail is not None and tails.get(key) is not tail:
+                        tail.close()
+                    continue
                 if chunk:
                     sys.stdout.write(chunk)
                     sys.stdout.flush()
-            except OSError:
-                pass
+    finally:
+        for tail in tails.values():
+            tail.close()
 
 
 async def _main(foreground: bool = False, workspace_path: Path | None = None, admin: bool = False) -> None:
@@ -102,15 +169,22 @@ async def _main(foreground: bool = False, workspace_path: Path | None = None, ad
 
     channel_manager: ChannelManager | None = None
 
+    loop = asyncio.get_running_loop()
+
     def _shutdown(*_: object) -> None:
         log.info("Shutdown signal received")
         stop_event.set()
 
-    if sys.platform == "win32":
-        signal.signal(signal.SIGBREAK, _shutdown)
-    signal.signal(signal.SIGTERM, _shutdown)
-    if hasattr(signal, "SIGINT"):
-        signal.signal(signal.SIGINT, _shutdown)
+    if sys.platform != "win32":
+        # Runs _shutdown as a regular loop callback rather than from inside
+        # the Python-level signal handler.
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, _shutdown)
+    else:
+        # No add_signal_handler on Windows loops; hop onto the loop so the
+        # Event waiters are woken from the loop's own context.
+        for sig in (signal.SIGBREAK, signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, lambda *_: loop.call_soon_threadsafe(_shutdown))
 
     async def _on_channel_event(event: str, data: dict[str, object]) -> None:
         nonlocal channel_manager
@@ -161,22 +235,12 @@ async def _main(foreground: bool = False, workspace_path: Path | None = None, ad
             from hiro_commons.attestation import create_device_attestation
 
             device_id = f"{DEVICE_ID_PREFIX}{uuid.uuid4().hex[:DEVICE_ID_SUFFIX_LENGTH]}"
-            attestation = create_device_attestation(
+            attestation, claims = create_device_attestation(
                 desktop_private_key,
                 device_id=device_id,
                 device_public_key_b64=device_public_key,
                 expires_days=config.attestation_expires_days,
             )
-            blob = json.loads(attestation["blob"])
-            expires_at_raw = blob.get("expires_at")
-            expires_at = None
-            if isinstance(expires_at_raw, str):
-                try:
-                    expires_at = datetime.fromisoformat(
-                        expires_at_raw.replace("Z", "+00:00")
-                    ).astimezone(UTC)
-                except Exception:
-                    expires_at = None
 
             upsert_approved_device(
                 workspace_path,
@@ -184,7 +248,7 @@ async def _main(foreground: bool = False, workspace_path: Path | None = None, ad
                     device_id=device_id,
                     device_public_key=device_public_key,
                     paired_at=datetime.now(UTC),
-                    expires_at=expires_at,
+                    expires_at=claims.expires_at,
                     metadata={"source": "gateway_pairing"},
                     device_name=device_name,
                 ),
@@ -282,4 +346,5 @@ def _spawn_server(workspace_path: Path, admin: bool = False) -> None:
 if __name__ == "__main__":
     # Read admin flag from env var set by tools/server.py for background spawns.
     _admin = os.environ.get(ENV_ADMIN_UI) == "1"
-    asyncio.run(_main(admin=_admin))
+    # uvloop where installed (non-Windows); same semantics as asyncio.run.
+    run_event_loop(_main(admin=_admin))
@@ -1,40 +1,43 @@
 from .base import Tool
-from .channel import (
-    ChannelDisableTool,
-    ChannelEnableTool,
-    ChannelInstallTool,
-    ChannelListTool,
-    ChannelRemoveTool,
-    ChannelSetupTool,
-)
-from .device import DeviceAddTool, DeviceListTool, DeviceRevokeTool
-from .gateway import (
-    GatewaySetupTool,
-    GatewayStartTool,
-    GatewayStatusTool,
-    GatewayStopTool,
-    GatewayTeardownTool,
-)
-from .server import (
-    RestartTool,
-    SetupTool,
-    StartTool,
-    StatusTool,
-    StopTool,
-    TeardownTool,
-    UninstallTool,
-)
-from .workspace import (
-    WorkspaceCreateTool,
-    WorkspaceListTool,
-    WorkspaceRemoveTool,
-    WorkspaceShowTool,
-    WorkspaceUpdateTool,
-)
 
 
 def all_tools() -> list[Tool]:
     """Return one fresh instance of every registered tool."""
+    # Imported here, not at package level: importing any single tools.<x>
+    # module (as every CLI command does) would otherwise load all of them.
+    from .channel import (
+        ChannelDisableTool,
+        ChannelEnableTool,
+        ChannelInstallTool,
+        ChannelListTool,
+        ChannelRemoveTool,
+        ChannelSetupTool,
+    )
+    from .device import DeviceAddTool, DeviceListTool, DeviceRevokeTool
+    from .gateway import (
+        GatewaySetupTool,
+        GatewayStartTool,
+        GatewayStatusTool,
+        GatewayStopTool,
+        GatewayTeardownTool,
+    )
+    from .server import (
+        RestartTool,
+        SetupTool,
+        StartTool,
+        StatusTool,
+        StopTool,
+        TeardownTool,
+        UninstallTool,
+    )
+    from .workspace import (
+        WorkspaceCreateTool,
+        WorkspaceListTool,
+        WorkspaceRemoveTool,
+        WorkspaceShowTool,
+        WorkspaceUpdateTool,
+    )
+
     return [
         DeviceAddTool(),
         DeviceListTool(),
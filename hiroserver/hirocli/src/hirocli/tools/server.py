@@ -163,7 +163,7 @@ def _do_start(
         return
 
     if foreground:
-        import asyncio as _asyncio
+        from hiro_commons.eventloop import run as run_event_loop
 
         from hirocli.runtime.server_process import _main
 
@@ -173,7 +173,7 @@ def _do_start(
             "[dim](Ctrl+C to stop)[/dim]"
         )
         try:
-            _asyncio.run(_main(foreground=True, workspace_path=workspace_path, admin=admin))
+            run_event_loop(_main(foreground=True, workspace_path=workspace_path, admin=admin))
         except KeyboardInterrupt:
             pass
         console.print("[green]Server stopped.[/green]")
@@ -0,0 +1,116 @@
+"""AgentManager reply handling."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from types import SimpleNamespace
+
+import pytest
+
+from hiro_channel_sdk.models import UnifiedMessage
+from hirocli.runtime.agent_manager import AgentManager
+
+
+class _FakeComm:
+    def __init__(self) -> None:
+        self.outbound: list[UnifiedMessage] = []
+
+    def subscribe(self, content_type: str) -> asyncio.Queue[UnifiedMessage]:
+        return asyncio.Queue()
+
+    async def enqueue_outbound(self, msg: UnifiedMessage) -> None:
+        self.outbound.append(msg)
+
+
+class _FakeAgent:
+    """Replies with the thread id so replies can be told apart per sender."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str]] = []
+        self.release = asyncio.Event()  # holds back turns whose body is "slow"
+
+    async def ainvoke(self, inputs: dict, config: dict) -> dict:
+        thread_id = config["configurable"]["thread_id"]
+        body = inputs["messages"][-1]["content"]
+        self.calls.append((thread_id, body))
+        if body == "slow":
+            await self.release.wait()
+        return {"messages": [SimpleNamespace(content=f"{thread_id} <- {body}")]}
+
+
+def _manager(tmp_path) -> tuple[AgentManager, _FakeComm, _FakeAgent]:
+    comm = _FakeComm()
+    agent = _FakeAgent()
+    manager = AgentManager(comm, tmp_path)  # type: ignore[arg-type]
+    manager._agent = agent
+    # Thread ids normally come from workspace.db; channel:sender is enough here.
+    manager._resolve_thread_id = lambda msg: f"{msg.channel}:{msg.sender_id}"  # type: ignore[method-assign]
+    return manager, comm, agent
+
+
+def _inbound(sender: str, msg_id: str, body: str) -> UnifiedMessage:
+    return UnifiedMessage(
+        id=msg_id,
+        channel="devices",
+        direction="inbound",
+        sender_id=sender,
+        body=body,
+    )
+
+
+@pytest.mark.asyncio
+async def test_same_message_id_from_two_senders_gets_separate_replies(tmp_path) -> None:
+    manager, comm, agent = _manager(tmp_path)
+
+    await manager._process_batch([_inbound("alice", "1", "hello")])
+    await manager._process_batch([_inbound("bob", "1", "secret?")])
+
+    assert agent.calls == [("devices:alice", "hello"), ("devices:bob", "secret?")]
+    assert [(r.recipient_id, r.body) for r in comm.outbound] == [
+        ("alice", "devices:alice <- hello"),
+        ("bob", "devices:bob <- secret?"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_redelivered_message_reuses_cached_reply(tmp_path) -> None:
+    manager, comm, agent = _manager(tmp_path)
+
+    await manager._process_batch([_inbound("alice", "1", "hello")])
+    await manager._process_batch([_inbound("alice", "1", "hello")])
+
+    assert agent.calls == [("devices:alice", "hello")]
+    assert [r.body for r in comm.outbound] == ["devices:alice <- hello"] * 2
+
+
+@pytest.mark.asyncio
+async def test_fast_reply_is_not_held_back_by_slow_turn(tmp_path) -> None:
+    manager, comm, agent = _manager(tmp_path)
+
+    task = asyncio.create_task(
+        manager._process_batch([_inbound("alice", "1", "slow"), _inbound("bob", "1", "fast")])
+    )
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert [r.recipient_id for r in comm.outbound] == ["bob"]
+
+    agent.release.set()
+    await task
+    assert [r.recipient_id for r in comm.outbound] == ["bob", "alice"]
+
+
+@pytest.mark.asyncio
+async def test_next_batch_stops_at_second_turn_of_a_conversation(tmp_path) -> None:
+    manager, _, _ = _manager(tmp_path)
+    queue: asyncio.Queue[UnifiedMessage] = asyncio.Queue()
+    for msg_id, sender in enumerate(["alice", "bob", "alice", "carol", "alice"]):
+        queue.put_nowait(_inbound(sender, str(msg_id), "hi"))
+    carry: deque[UnifiedMessage] = deque()
+
+    batches = []
+    while len(batches) < 3:
+        batches.append([m.id for m in await manager._next_batch(queue, carry)])
+        assert len(carry) <= 1
+
+    assert batches == [["0", "1"], ["2", "3"], ["4"]]
@@ -0,0 +1,89 @@
+"""CommunicationManager outbound path through the real ChannelManager."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from hiro_channel_sdk.constants import JSONRPC_VERSION, METHOD_SEND
+from hiro_channel_sdk.models import UnifiedMessage
+from hirocli.runtime.channel_manager import ChannelManager
+from hirocli.runtime.communication_manager import CommunicationManager
+
+
+class _RecordingWs:
+    def __init__(self) -> None:
+        self.frames: list[str | bytes] = []
+
+    async def send(self, frame: str | bytes) -> None:
+        self.frames.append(frame)
+
+
+@pytest.mark.asyncio
+async def test_outbound_message_reaches_channel_socket(tmp_path) -> None:
+    comm = CommunicationManager()
+    channels = ChannelManager(
+        SimpleNamespace(plugin_port=0),  # type: ignore[arg-type]
+        tmp_path,
+        asyncio.Event(),
+        on_message=comm.receive,
+    )
+    comm.set_channel_manager(channels)
+    ws = _RecordingWs()
+    channels._channels["devices"] = SimpleNamespace(name="devices", ws=ws)  # type: ignore[assignment]
+
+    msg = UnifiedMessage(
+        channel="devices",
+        direction="outbound",
+        sender_id="server",
+        recipient_id="alice",
+        body="hello",
+    )
+    worker = asyncio.create_task(comm.run())
+    try:
+        await comm.enqueue_outbound(msg)
+        await asyncio.wait_for(comm.outbound_queue.join(), timeout=1)
+    finally:
+        worker.cancel()
+
+    assert len(ws.frames) == 1
+    frame = json.loads(ws.frames[0])
+    assert frame["jsonrpc"] == JSONRPC_VERSION
+    assert frame["method"] == METHOD_SEND
+    params = frame["params"]
+    assert (params["id"], params["recipient_id"], params["body"]) == (msg.id, "alice", "hello")
+
+
+class _FlakyChannels:
+    """Fails every send to the "broken" channel."""
+
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+
+    async def send_to_channel(self, channel_name: str, message_json: bytes) -> None:
+        if channel_name == "broken":
+            raise ConnectionError("plugin socket closed")
+        self.sent.append(channel_name)
+
+
+@pytest.mark.asyncio
+async def test_failed_send_does_not_stop_outbound_worker() -> None:
+    comm = CommunicationManager()
+    channels = _FlakyChannels()
+    comm.set_channel_manager(channels)  # type: ignore[arg-type]
+
+    worker = asyncio.create_task(comm.run())
+    try:
+        for channel in ["broken", "devices", "broken", "devices"]:
+            await comm.enqueue_outbound(
+                UnifiedMessage(channel=channel, direction="outbound", sender_id="server", body="hi")
+            )
+            await asyncio.wait_for(comm.outbound_queue.join(), timeout=1)
+        assert not worker.done()
+    finally:
+        worker.cancel()
+
+    assert channels.sent == ["devices", "devices"]